@@ -2,7 +2,9 @@
 
 import copy
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Tuple
+
+import numpy as np
 
 from psu_capstone.encoder_layer.base_encoder import BaseEncoder
 from psu_capstone.encoder_layer.rdse import RandomDistributedScalarEncoder, RDSEParameters
@@ -58,6 +60,9 @@ class CategoryEncoder(BaseEncoder):
         self._RDSEused = self._parameters.rdse_used
         self._num_categories = len(self._category_list) + 1
         self._size = self._num_categories * self._w
+        self._idx: Dict[str, int] = {name: i + 1 for i, name in enumerate(self._category_list)}
+        self._cache: Dict[int, Tuple[int, ...]] = {}
+        """Sparse output per category index for the RDSE path, filled on first use."""
 
         super().__init__(dimensions, self._size)
         """
@@ -93,13 +98,25 @@ class CategoryEncoder(BaseEncoder):
             )
             self.encoder = ScalarEncoder(self.sp, dimensions=[self.sp.size])
             self._dimensions = [self.sp.size]
+            """
+            With a radius of 1 the scalar encoder gives category i the bits [i*w, (i+1)*w),
+            so every output is precomputed here as one row per category index.
+            """
+            self._bits_lut = np.arange(self._size, dtype=np.int64).reshape(-1, self._w)
 
     def encode(self, input_value: str, output_sdr: SDR) -> None:
-        if input_value not in self._category_list:
-            index = 0
-        else:
-            index = self._category_list.index(input_value) + 1
-        self.encoder.encode(float(index), output_sdr)
+        index = self._idx.get(input_value, 0)
+        if not self._RDSEused:
+            assert output_sdr.size == self._size, "Output SDR size does not match encoder size."
+            output_sdr.set_sparse(self._bits_lut[index].tolist())
+            return
+        bits = self._cache.get(index)
+        if bits is None:
+            self.encoder.encode(float(index), output_sdr)
+            self._cache[index] = tuple(output_sdr.get_sparse())
+            return
+        assert output_sdr.size == self._size, "Output SDR size does not match encoder size."
+        output_sdr.set_sparse(list(bits))
 
     def check_parameters(self, parameters: CategoryParameters):
         if parameters.w <= 0:
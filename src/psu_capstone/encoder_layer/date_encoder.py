@@ -33,8 +33,9 @@ import math
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Set
+from typing import Dict, List, Sequence, Set
 
+import numpy as np
 import pandas as pd
 
 from psu_capstone.encoder_layer.base_encoder import BaseEncoder
@@ -562,6 +563,32 @@ class DateEncoder(BaseEncoder):
         output.zero()
         output.set_sparse(all_sparse)
 
+    def encode_many(
+        self,
+        input_values: Sequence[datetime | pd.Timestamp | float | time.struct_time | None],
+    ) -> np.ndarray:
+        """
+        Encode a sequence of timestamp-like values into a dense matrix.
+
+        Each value still goes through :meth:`encode` one at a time; only the scratch SDR
+        and the output matrix are shared across rows.
+
+        Args:
+            input_values: Values accepted by :meth:`encode`, one per row.
+
+        Returns:
+            ``(len(input_values), size)`` uint8 array; row ``i`` is the
+            encoding of ``input_values[i]``.
+        """
+        encoded = np.zeros((len(input_values), self._size), dtype=np.uint8)
+        scratch = SDR(dimensions=[self._size])
+
+        for row, value in enumerate(input_values):
+            self.encode(value, scratch)
+            encoded[row, scratch.get_sparse()] = 1
+
+        return encoded
+
     def _holiday_value(self, t: time.struct_time) -> float:
         """Return the holiday ramp value for the provided timestamp."""
         seconds_per_day = 86400.0
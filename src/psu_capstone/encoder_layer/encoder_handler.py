@@ -7,8 +7,10 @@ from the encoded columns.
 """
 
 import copy
+import logging
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, List, Self
+from typing import ClassVar, DefaultDict, Hashable, List, Self, Tuple
 
 import numpy as np  # Add this import
 import pandas as pd
@@ -20,6 +22,8 @@ from psu_capstone.encoder_layer.rdse import RandomDistributedScalarEncoder, RDSE
 from psu_capstone.encoder_layer.scalar_encoder import ScalarEncoder, ScalarEncoderParameters
 from psu_capstone.encoder_layer.sdr import SDR
 
+logger = logging.getLogger(__name__)
+
 
 class EncoderHandler:
     """Handles multiple encoders to create composite SDRs.
@@ -29,7 +33,9 @@ class EncoderHandler:
     based on its dtype and builds a composite SDR from the encoded columns.
     """
 
-    __instance: Self | None = None
+    __slots__ = ("_data_frame", "_encoders", "_by_type")
+
+    __instance: ClassVar[Self | None] = None
 
     def __new__(cls, input_data: pd.DataFrame) -> "EncoderHandler":
         """Implements the singleton pattern for EncoderHandler.
@@ -41,25 +47,175 @@ class EncoderHandler:
             EncoderHandler: The singleton instance.
         """
 
-        if cls.__instance is None:
-            cls.__instance = super(EncoderHandler, cls).__new__(cls)
+        if cls.__instance is not None:
+            return cls.__instance
 
-        return cls.__instance
+        instance = super(EncoderHandler, cls).__new__(cls)
+        cls.__instance = instance
+        return instance
 
     def __init__(self, input_data: pd.DataFrame):
         """Initializes the EncoderHandler with a DataFrame of input data.
 
+        Only the first construction initializes the singleton; later calls return the same
+        instance without copying the input data again.
+
         Args:
             input_data (pd.DataFrame): DataFrame containing input data.
         """
+        if hasattr(self, "_encoders"):
+            return
+
         self._data_frame = copy.deepcopy(input_data)
         self._encoders: List[BaseEncoder] = []
+        # Column positions of the current encoders, grouped by encoder type.
+        self._by_type: DefaultDict[type, List[int]] = defaultdict(list)
+
+    @staticmethod
+    def _first_row(input_data: pd.DataFrame) -> np.ndarray:
+        """Returns the first row of the input data as plain Python values.
+
+        ``iloc[0]`` builds an indexed Series and upcasts ints to floats whenever every column
+        is numeric, which would send int columns to the RDSE. Converting the one-row slice to
+        an object array keeps each column's own type and is a single conversion.
+
+        Args:
+            input_data (pd.DataFrame): DataFrame whose first row is read.
+
+        Returns:
+            np.ndarray: Object array with one value per column.
+        """
+        return input_data.iloc[:1].to_numpy(dtype=object)[0]
+
+    def _select_encoder(
+        self, col_name: Hashable, value: object, input_data: pd.DataFrame
+    ) -> BaseEncoder:
+        """Builds the encoder for a column based on the type of its value.
+
+        Args:
+            col_name (Hashable): Name of the column being encoded.
+            value (object): Column value whose type selects the encoder.
+            input_data (pd.DataFrame): Full input data, used for category lists.
+
+        Returns:
+            BaseEncoder: Encoder configured for the column.
+
+        Raises:
+            TypeError: If the value type is unsupported.
+        """
+        if isinstance(value, float) or isinstance(value, np.floating):
+            encoder: BaseEncoder = RandomDistributedScalarEncoder(
+                RDSEParameters(
+                    active_bits=5,
+                    sparsity=0.0,
+                    size=10,
+                    radius=10.0,
+                    resolution=0.0,
+                    category=False,
+                    seed=42,
+                )
+            )
+
+        elif isinstance(value, int) or isinstance(value, np.integer):
+            encoder = ScalarEncoder(
+                ScalarEncoderParameters(
+                    minimum=0.0,
+                    maximum=100.0,
+                    clip_input=True,
+                    periodic=False,
+                    active_bits=5,
+                    sparsity=0.0,
+                    size=10,
+                    radius=0.0,
+                    category=False,
+                    resolution=0.0,
+                )
+            )
+
+        elif isinstance(value, str):
+            # Build category_list from all unique values in the column
+            category_list = input_data[col_name].unique().tolist()
+            encoder = CategoryEncoder(CategoryParameters(w=3, category_list=category_list))
+            logger.debug("Encoding string value '%s' with category list: %s", value, category_list)
+
+        elif isinstance(value, pd.Timestamp) or isinstance(value, datetime):
+            encoder = DateEncoder(
+                DateEncoderParameters(
+                    season_width=0,
+                    season_radius=91.5,
+                    day_of_week_width=3,
+                    day_of_week_radius=1.0,
+                    weekend_width=3,
+                    holiday_width=0,
+                    holiday_dates=[[12, 25]],
+                    time_of_day_width=3,
+                    time_of_day_radius=4.0,
+                    custom_width=0,
+                    custom_days=[],
+                    rdse_used=False,
+                )
+            )
+
+        else:
+            raise TypeError(f"Unsupported value type for encoder: {type(value)}")
+
+        return encoder
+
+    def _select_columns(self, input_data: pd.DataFrame) -> Tuple[List[int], List[SDR]]:
+        """Selects an encoder for each column and encodes the first row with it.
+
+        Encoders are chosen from the type of each column's first value. Columns whose first
+        value encodes to an empty SDR are skipped, so build_composite_sdr and
+        build_composite_dense always agree on the columns they use. The kept encoders are
+        stored in ``_encoders``.
+
+        Args:
+            input_data (pd.DataFrame): DataFrame whose first row selects the encoders.
+
+        Returns:
+            Tuple[List[int], List[SDR]]: Positions of the kept columns and their first-row
+            encodings, aligned with ``_encoders``.
+
+        Raises:
+            TypeError: If a column's value type is unsupported.
+            ValueError: If every column encodes to an empty SDR.
+        """
+        row = self._first_row(input_data)
+        self._encoders = []  # Reset encoders for each call
+        columns: List[int] = []
+        sdrs: List[SDR] = []
+
+        for position, (col_name, value) in enumerate(zip(input_data.columns, row)):
+            encoder = self._select_encoder(col_name, value, input_data)
+            sdr = SDR([encoder.size])
+            if isinstance(encoder, (RandomDistributedScalarEncoder, ScalarEncoder)):
+                encoder.encode(float(value), sdr)
+            else:
+                encoder.encode(value, sdr)
+
+            logger.debug("Column '%s' encoded sparse SDR: %s", col_name, sdr.get_sparse())
+            if sdr.get_sparse() == []:
+                logger.warning(
+                    "Encoding failed for column '%s' with value '%s' and encoder '%s'",
+                    col_name,
+                    value,
+                    type(encoder).__name__,
+                )
+                continue  # Skip this column
+            self._encoders.append(encoder)
+            columns.append(position)
+            sdrs.append(sdr)
+
+        if not self._encoders:
+            raise ValueError("No SDRs were created from the input data.")
+        return columns, sdrs
 
     def build_composite_sdr(self, input_data: pd.DataFrame) -> SDR:
         """Builds a composite SDR from multiple encoders based on the input data.
 
-        For each column in the input DataFrame, selects an encoder based on the column's dtype,
-        encodes the value, and concatenates the resulting SDRs into a single composite SDR.
+        Each column kept by _select_columns has its first-row encoding shifted by the running
+        width of the previous columns. The gathered indices are written into a single
+        composite SDR in one call.
 
         Args:
             input_data (pd.DataFrame): DataFrame containing input values for each encoder.
@@ -71,110 +227,101 @@ class EncoderHandler:
             TypeError: If a column's value type is unsupported.
             ValueError: If no SDRs are created or an unexpected error occurs.
         """
-        row = input_data.iloc[0]
-        sdrs = []
-        self._encoders = []  # Reset encoders for each call
+        _, sdrs = self._select_columns(input_data)
+        active: List[np.ndarray] = []
+        offset = 0
+
+        for sdr in sdrs:
+            # Sparse indices are flat and sorted, so shifting each column past the
+            # previous ones keeps the gathered indices sorted as well.
+            active.append(np.asarray(sdr.get_sparse(), dtype=np.int64) + offset)
+            offset += sdr.size
+
+        composite_sdr = SDR([offset])
+        composite_sdr.set_sparse(np.concatenate(active).tolist())
+        return composite_sdr
+
+    def build_composite_dense(self, input_data: pd.DataFrame) -> np.ndarray:
+        """Encodes every row of the input data into a dense composite matrix.
+
+        Columns and encoders come from _select_columns, as in build_composite_sdr, so the
+        first row of the result matches the composite SDR. The encoders are then grouped by
+        type, so each type is encoded in one pass over its columns. Scalar columns that share
+        parameters go through a single vectorised encode_batch call, date columns through
+        encode_many, and the remaining columns row by row into a scratch SDR. Each column's
+        block is written straight into its slice of the output.
 
-        for col_name, value in row.items():
-            # Select encoder based on dtype
-            if isinstance(value, float) or isinstance(value, np.floating):
-                encoder = RandomDistributedScalarEncoder(
-                    RDSEParameters(
-                        active_bits=5,
-                        sparsity=0.0,
-                        size=10,
-                        radius=10.0,
-                        resolution=0.0,
-                        category=False,
-                        seed=42,
-                    )
-                )
-                sdr = SDR([encoder.size])
-                encoder.encode(float(value), sdr)
+        Args:
+            input_data (pd.DataFrame): DataFrame whose rows are all encoded.
 
-            elif isinstance(value, int) or isinstance(value, np.integer):
-                encoder = ScalarEncoder(
-                    ScalarEncoderParameters(
-                        minimum=0.0,
-                        maximum=100.0,
-                        clip_input=True,
-                        periodic=False,
-                        active_bits=5,
-                        sparsity=0.0,
-                        size=10,
-                        radius=0.0,
-                        category=False,
-                        resolution=0.0,
-                    )
-                )
-                sdr = SDR([encoder.size])
-                encoder.encode(float(value), sdr)
+        Returns:
+            np.ndarray: ``(n_rows, total_size)`` uint8 matrix, one composite encoding per row.
 
-            elif isinstance(value, str):
-                # Build category_list from all unique values in the column
-                category_list = input_data[col_name].unique().tolist()
-                encoder = CategoryEncoder(CategoryParameters(w=3, category_list=category_list))
-                print(
-                    f"Encoding string value '{value}' with category list: {encoder._parameters.category_list}"
-                )
-                sdr = SDR(encoder.dimensions)
-                encoder.encode(value, sdr)
+        Raises:
+            TypeError: If a column's value type is unsupported.
+            ValueError: If every column encodes to an empty SDR.
+        """
+        columns, _ = self._select_columns(input_data)
 
-            elif isinstance(value, pd.Timestamp) or isinstance(value, datetime):
-                encoder = DateEncoder(
-                    DateEncoderParameters(
-                        season_width=0,
-                        season_radius=91.5,
-                        day_of_week_width=3,
-                        day_of_week_radius=1.0,
-                        weekend_width=3,
-                        holiday_width=0,
-                        holiday_dates=[[12, 25]],
-                        time_of_day_width=3,
-                        time_of_day_radius=4.0,
-                        custom_width=0,
-                        custom_days=[],
-                        rdse_used=False,
-                    )
-                )
-                # Use encoder.size for SDR size
-                sdr = SDR([encoder.size])
-                encoder.encode(value, sdr)
+        self._by_type = defaultdict(list)
+        for index, encoder in enumerate(self._encoders):
+            self._by_type[type(encoder)].append(index)
 
-            else:
-                raise TypeError(f"Unsupported value type for encoder: {type(value)}")
+        bounds = np.concatenate(([0], np.cumsum([encoder.size for encoder in self._encoders])))
+        encoded = np.zeros((len(input_data), int(bounds[-1])), dtype=np.uint8)
 
-            print(f"Column '{col_name}' encoded sparse SDR:", sdr.get_sparse())
-            if sdr.get_sparse() == []:
-                print(
-                    f"Warning: Encoding failed for column '{col_name}' with value '{value}' and encoder '{type(encoder).__name__}'"
-                )
-                continue  # Skip this column
-            self._encoders.append(copy.deepcopy(encoder))
-            sdrs.append(copy.deepcopy(sdr))
+        for indices in self._by_type.values():
+            self._encode_group(indices, columns, input_data, encoded, bounds)
 
-        if not sdrs:
-            raise ValueError("No SDRs were created from the input data.")
+        return encoded
 
-        if len(sdrs) >= 2:
-            # Flatten all SDRs to 1D before concatenation
-            flat_sdrs = []
-            for sdr in sdrs:
-                # If SDR is not 1D, flatten it
-                if len(sdr.dimensions) != 1:
-                    flat_sdr = SDR([sdr.size])
-                    flat_sdr.set_sparse(sdr.get_sparse())
-                    flat_sdrs.append(flat_sdr)
-                else:
-                    flat_sdrs.append(sdr)
-            total_size = sum(sdr.size for sdr in flat_sdrs)
-            union_sdr = SDR([total_size])
-            union_sdr.concatenate(flat_sdrs, axis=0)
-            return union_sdr
-        elif len(sdrs) == 1:
-            return copy.deepcopy(sdrs[0])
-        else:
-            raise ValueError("Unexpected error in building composite SDR.")
+    def _encode_group(
+        self,
+        indices: List[int],
+        columns: List[int],
+        input_data: pd.DataFrame,
+        encoded: np.ndarray,
+        bounds: np.ndarray,
+    ) -> None:
+        """Encodes a group of same-type columns into their slices of the composite matrix.
+
+        Args:
+            indices (List[int]): Positions in ``_encoders`` that all use the same encoder type.
+            columns (List[int]): Column position in the input data for each encoder.
+            input_data (pd.DataFrame): DataFrame whose rows are all encoded.
+            encoded (np.ndarray): Composite matrix written in place.
+            bounds (np.ndarray): Start offset of each column's block, plus the total width.
+        """
+        group = [self._encoders[i] for i in indices]
+        first = group[0]
+
+        if isinstance(first, ScalarEncoder) and all(
+            isinstance(encoder, ScalarEncoder) and encoder._parameters == first._parameters
+            for encoder in group
+        ):
+            values = input_data.iloc[:, [columns[i] for i in indices]].to_numpy(dtype=np.float64)
+            block = first.encode_batch(values.reshape(-1)).reshape(len(values), len(indices), -1)
+            for j, i in enumerate(indices):
+                encoded[:, bounds[i] : bounds[i + 1]] = block[:, j]
+            return
+
+        for i in indices:
+            encoder = self._encoders[i]
+            column = input_data.iloc[:, columns[i]]
+            out = encoded[:, bounds[i] : bounds[i + 1]]
+
+            if isinstance(encoder, ScalarEncoder):
+                out[:] = encoder.encode_batch(column.to_numpy(dtype=np.float64))
+                continue
+
+            items = column.tolist()
+            if isinstance(encoder, DateEncoder):
+                out[:] = encoder.encode_many(items)
+            else:
+                scratch = SDR([encoder.size])
+                for r, item in enumerate(items):
+                    encoder.encode(item, scratch)
+                    out[r, scratch.get_sparse()] = 1
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@ import math
 import random
 import struct
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import mmh3
 
@@ -11,6 +11,15 @@ from psu_capstone.encoder_layer.base_encoder import BaseEncoder
 from psu_capstone.encoder_layer.sdr import SDR
 from psu_capstone.utils import Parameters
 
+_HASH_INDEX = struct.Struct("I")
+"""Precompiled packer for the unsigned 32-bit bucket index fed to murmur hash."""
+
+BUCKET_CACHE_SIZE = 4096
+"""Most bucket encodings an RDSE keeps; the oldest entry is dropped past this."""
+
+_RNG = random.Random()
+"""Shared generator that replaces seed 0; tests swap it for a seeded one."""
+
 """
  * Parameters for the RandomDistributedScalarEncoder (RDSE)
  *
@@ -93,6 +102,8 @@ class RandomDistributedScalarEncoder(BaseEncoder):
         self._resolution = self._parameters.resolution
         self._category = self._parameters.category
         self._seed = self._parameters.seed
+        self._bucket_cache: Dict[int, Tuple[int, ...]] = {}
+        """Sorted active bits per bucket index; the output is fixed once the seed is set."""
 
         super().__init__(dimensions, self._size)
 
@@ -110,14 +121,25 @@ class RandomDistributedScalarEncoder(BaseEncoder):
             if input_value != int(input_value) or input_value < 0:
                 raise ValueError("Input to category encoder must be an unsigned integer")
 
-        data = [0] * self.size
-
         index = int(input_value / self._resolution)
-
+        bits = self._bucket_cache.get(index)
+        if bits is None:
+            bits = self._bucket_bits(index)
+            if len(self._bucket_cache) >= BUCKET_CACHE_SIZE:
+                del self._bucket_cache[next(iter(self._bucket_cache))]
+            self._bucket_cache[index] = bits
+
+        output.set_sparse(list(bits))
+
+    def _bucket_bits(self, index: int) -> Tuple[int, ...]:
+        """Hash the ``active_bits`` consecutive bucket indices starting at ``index``."""
+        pack = _HASH_INDEX.pack
+        seed = self._seed
+        size = self._size
+
+        active = set()
         for offset in range(self._active_bits):
-            hash_buffer = index + offset
-            bucket = mmh3.hash(struct.pack("I", hash_buffer), self._seed, signed=False)
-            bucket = bucket % self.size
+            bucket = mmh3.hash(pack(index + offset), seed, signed=False) % size
             """
                 Don't worry about hash collisions.  Instead measure the critical
                 properties of the encoder in unit tests and quantify how significant
@@ -126,32 +148,24 @@ class RandomDistributedScalarEncoder(BaseEncoder):
                 deviations in the sparsity or semantic similarity, depending on how
                 they're handled.
             """
-            data[bucket] = 1
+            active.add(bucket)
 
-        output.set_dense(data)
+        return tuple(sorted(active))
 
     # After encode we may need a check_parameters method since most of the encoders have this
     def check_parameters(self, parameters: RDSEParameters):
         assert parameters.size > 0
 
-        num_active_args = 0
-        if parameters.active_bits > 0:
-            num_active_args += 1
-        if parameters.sparsity > 0:
-            num_active_args += 1
+        num_active_args = sum([parameters.active_bits > 0, parameters.sparsity > 0])
 
         assert num_active_args != 0, "Missing argument, need one of: 'activeBits' or 'sparsity'."
         assert (
             num_active_args == 1
         ), "Too many arguments, choose only one of: 'activeBits' or 'sparsity'."
 
-        num_resolution_args = 0
-        if parameters.radius > 0:
-            num_resolution_args += 1
-        if parameters.category:
-            num_resolution_args += 1
-        if parameters.resolution > 0:
-            num_resolution_args += 1
+        num_resolution_args = sum(
+            [parameters.radius > 0, bool(parameters.category), parameters.resolution > 0]
+        )
 
         assert (
             num_resolution_args != 0
@@ -176,7 +190,7 @@ class RandomDistributedScalarEncoder(BaseEncoder):
             args.radius = args.active_bits * args.resolution
 
         while args.seed == 0:
-            args.seed = random.getrandbits(32)
+            args.seed = _RNG.getrandbits(32)
 
         return args
 
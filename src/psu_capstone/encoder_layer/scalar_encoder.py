@@ -15,7 +15,9 @@
 import copy
 import math
 from dataclasses import dataclass
-from typing import List, Union
+from typing import List, Sequence, Union
+
+import numpy as np
 
 from psu_capstone.encoder_layer.base_encoder import BaseEncoder
 from psu_capstone.encoder_layer.sdr import SDR
@@ -130,6 +132,11 @@ class ScalarEncoder(BaseEncoder):
         self._radius = self._parameters.radius
         self._resolution = self._parameters.resolution
 
+        # Everything below is fixed once the parameters are checked, so work it out
+        # here instead of on every encode call.
+        self._max_start = self._size - self._active_bits
+        self._offsets = np.arange(self._active_bits)
+
         super().__init__(dimensions, self._size)
 
     """
@@ -164,7 +171,9 @@ class ScalarEncoder(BaseEncoder):
                     f"Received {input_value}"
                 )
 
-        start = int(round((input_value - self._minimum) / self._resolution))
+        # Round half up like std::round does for these non-negative offsets; Python's
+        # round() goes to the even bucket and would send 10.5 to the same bucket as 10.0.
+        start = int(math.floor((input_value - self._minimum) / self._resolution + 0.5))
 
         """Handle edge case where start + active_bits exceeds output size.
           // The endpoints of the input range are inclusive, which means that the
@@ -173,22 +182,92 @@ class ScalarEncoder(BaseEncoder):
           // last bit in the SDR.
         """
         if not self._periodic:
-            start = min(start, output_sdr.size - self._active_bits)
+            start = min(start, self._max_start)
+            sparse = list(range(start, start + self._active_bits))
+        else:
+            # A wrapped block is the head [0, overflow) followed by the tail [start, size),
+            # both already in sorted order.
+            start %= self._size
+            overflow = start + self._active_bits - self._size
+            if overflow > 0:
+                sparse = list(range(overflow)) + list(range(start, self._size))
+            else:
+                sparse = list(range(start, start + self._active_bits))
 
-        sparse = output_sdr.get_sparse()
-        sparse[:] = range(start, start + self._active_bits)
+        output_sdr.set_sparse(sparse)
 
-        if self._periodic:
-            for i, bit in enumerate(sparse):
-                if bit >= output_sdr.size:
-                    sparse[i] = bit - output_sdr.size
-            sparse.sort()
+        return True
 
-        output_sdr.set_sparse(sparse)
+    def encode_batch(self, input_values: Sequence[float] | np.ndarray) -> np.ndarray:
+        """
+        Encode a batch of values into a dense matrix using the same rules as :meth:`encode`.
+
+        Args:
+            input_values: Scalars accepted by :meth:`encode`, one per row.
+
+        Returns:
+            ``(len(input_values), size)`` uint8 array; row ``i`` is the
+            encoding of ``input_values[i]``. NaN inputs give an all-zero row.
+
+        Raises:
+            ValueError: If any value would be rejected by :meth:`encode`.
+        """
+        active = self.encode_batch_sparse(input_values)
+        rows = np.flatnonzero(active[:, 0] >= 0)
+
+        encoded = np.zeros((len(active), self._size), dtype=np.uint8)
+        encoded[rows[:, None], active[rows]] = 1
+        return encoded
+
+    def encode_batch_sparse(self, input_values: Sequence[float] | np.ndarray) -> np.ndarray:
+        """
+        Compute the active bits of a batch of values using the same rules as :meth:`encode`.
+
+        Each row is the bucket start plus ``arange(active_bits)``, wrapped modulo the size
+        when periodic. Rows are sorted, so they list the same bits in the same order as the
+        sparse output of :meth:`encode`.
 
-        self.__sdr = output_sdr
+        Args:
+            input_values: Scalars accepted by :meth:`encode`, one per row.
+
+        Returns:
+            ``(len(input_values), active_bits)`` int64 array of sorted active bit indices.
+            NaN inputs give a row of ``-1``.
+
+        Raises:
+            ValueError: If any value would be rejected by :meth:`encode`.
+        """
+        values = np.asarray(input_values, dtype=np.float64).reshape(-1)
+        nan = np.isnan(values)
+
+        if self._clip_input:
+            if self._periodic:
+                values = np.mod(values, self._maximum)
+            else:
+                values = np.clip(values, self._minimum, self._maximum)
+        else:
+            # One mask per rule over the whole batch; NaN compares false, so it never trips.
+            if self._category and np.any(~nan & (values != np.trunc(values))):
+                raise ValueError("Input to category encoder must be an unsigned integer!")
+            outside = (values < self._minimum) | (values > self._maximum)
+            if outside.any():
+                raise ValueError(
+                    f"Input must be within range [{self._minimum}, {self._maximum}]! "
+                    f"Received {values[outside][0]} (indices {np.flatnonzero(outside).tolist()})"
+                )
+
+        values = np.where(nan, self._minimum, values)
+        starts = np.floor((values - self._minimum) / self._resolution + 0.5).astype(np.int64)
+        if not self._periodic:
+            starts = np.minimum(starts, self._max_start)
+
+        active = starts[:, None] + self._offsets
+        if self._periodic:
+            active %= self._size
+            active.sort(axis=1)  # wrapped blocks start with their tail
 
-        return self.__sdr == output_sdr
+        active[nan] = -1
+        return active
 
     # After encode we may need a check_parameters method since most of the encoders have this
     def check_parameters(self, parameters: ScalarEncoderParameters):
@@ -9,8 +9,11 @@ in sync with each other. -- Renamed file
 from __future__ import annotations
 
 import random
+from array import array
 from math import prod
-from typing import Callable, Iterable, List, Optional, Sequence
+from typing import Callable, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
 
 # Type aliases mirroring the C++ implementation
 
@@ -20,31 +23,122 @@ sdr_dense_t = List[elem_dense]  #: Alias for the dense SDR container type.
 sdr_sparse_t = List[elem_sparse]  #: Alias for the sparse SDR container type.
 sdr_coordinate_t = List[List[int]]  #: Alias representing coordinates grouped per dimension.
 sdr_callback_t = Callable[[], None]  #: Callback signature invoked on SDR state changes.
+sdr_rng_t = Union[np.random.Generator, random.Random]  #: Generators accepted by random ops.
+
 
+DENSE_TYPECODE = "B"  #: ``array`` typecode of the dense buffer, one unsigned byte per bit.
 
 INPUT_SDR_NONE_MSG = "Input SDR cannot be None."  #: Common error message for null SDR inputs.
 
+WORD_BITS = 64  #: Number of SDR bits packed into each ``uint64`` word.
+OVERLAP_MIN_WORDS = 16  #: Word count below which overlap intersects sparse indices instead.
+
+
+def _pack_bits(bits: Union[Sequence[int], np.ndarray], size: int, sparse: bool) -> np.ndarray:
+    """Pack dense bits or sparse indices into little-endian ``uint64`` words.
+
+    Bit ``i`` of the SDR lands in bit ``i % 64`` of word ``i // 64``; padding
+    bits past ``size`` are always zero so word-wise metrics stay exact.
+    """
+    n_words = (int(size) + WORD_BITS - 1) // WORD_BITS
+    unpacked = np.zeros(n_words * WORD_BITS, dtype=np.uint8)
+    if sparse:
+        unpacked[np.asarray(bits, dtype=np.intp)] = 1
+    else:
+        unpacked[: int(size)] = bits
+    return np.packbits(unpacked, bitorder="little").view("<u8")
+
+
+def _unpack_bits(words: np.ndarray, size: int) -> np.ndarray:
+    """Unpack little-endian ``uint64`` words back into ``size`` dense ``uint8`` bits."""
+    return np.unpackbits(words.view(np.uint8), bitorder="little")[: int(size)]
+
+
+def _sparse_from_words(words: np.ndarray) -> List[int]:
+    """Return the sorted indices of the set bits in ``words``.
+
+    Only the non-zero words are unpacked, so a sparse SDR costs one scan of
+    its words plus a few bytes per active word rather than a full unpack.
+    Padding bits are always zero, so no trimming to ``size`` is needed.
+    """
+    active_words = np.flatnonzero(words)
+    if active_words.size == 0:
+        return []
+    bits = np.unpackbits(words[active_words].view(np.uint8), bitorder="little")
+    rows, cols = np.nonzero(bits.reshape(active_words.size, WORD_BITS))
+    return (active_words[rows] * WORD_BITS + cols).tolist()
+
+
+def _sample(rng: sdr_rng_t, population: Sequence[int], k: int) -> List[int]:
+    """Draw ``k`` distinct items from ``population`` with either supported generator type."""
+    if isinstance(rng, np.random.Generator):
+        picks = rng.choice(len(population), size=k, replace=False)
+        return [population[i] for i in picks.tolist()]
+    return rng.sample(population, k)
+
+
+class _ReadOnlyList(list):
+    """List handed out by ``SDR.get_dense``: compares like a list but rejects writes.
+
+    The list is cached on the SDR, so a write would make it disagree with the
+    sparse view. Copies are plain, writable lists.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "SDR.get_dense() returns a read-only list; use set_dense to change the SDR."
+        )
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def copy(self) -> List[int]:
+        return list(self)
+
+    def __reduce_ex__(self, protocol):
+        return (list, (list(self),))
+
+
+if hasattr(np, "bitwise_count"):
+
+    def _popcount(words: np.ndarray) -> int:
+        """Count set bits using NumPy's hardware popcount ufunc (NumPy >= 2.0)."""
+        return int(np.bitwise_count(words).sum())
+
+else:  # pragma: no cover - NumPy 1.x fallback
+
+    def _popcount(words: np.ndarray) -> int:
+        """Count set bits by unpacking the words into bytes (NumPy 1.x fallback)."""
+        return int(np.unpackbits(words.view(np.uint8)).sum())
+
 
 class SDR:
     """Python counterpart of NuPIC's SparseDistributedRepresentation.
 
-    The instance maintains dense, sparse, and coordinate views that lazily
-    materialise from whichever representation is currently authoritative.
+    The value is stored as bits packed into ``uint64`` words; every setter
+    refreshes the words. Dense, sparse, and coordinate views are caches that
+    lazily materialise from the words (or the view that was just set).
     Callbacks can be registered to observe mutations or destruction events.
 
     Attributes:
         __dimensions: Shape of the SDR as a list of ints.
         __size: Total number of bits in the SDR.
-        _dense: Backing dense bit vector representing active elements.
+        _dense: Backing dense bit vector, an ``array('B')`` with one byte per bit.
         _sparse: Cached list of active indices in sparse form.
         _coordinates: Cached coordinates for each active bit broken per dimension.
         _dense_valid: Flag indicating whether the dense buffer is authoritative.
         _sparse_valid: Flag indicating whether the sparse buffer is authoritative.
         _coordinates_valid: Flag indicating whether the coordinate cache is valid.
+        _words: SDR value packed into ``uint64`` words, bit ``i`` in word ``i // 64``.
+        _words_valid: Flag indicating whether the packed words hold the current value.
+        _dense_list: Read-only list returned by ``get_dense``, or ``None`` until requested.
         __callbacks: Registered change callbacks invoked after value updates.
         __destroy_callbacks: Callbacks invoked during ``destroy``.
+        _default_rng: Generator shared by ``randomize`` and ``add_noise`` when no ``rng`` is given.
     """
 
+    _default_rng: np.random.Generator = np.random.default_rng()
+
     def __init__(self, dimensions: List[int]) -> None:
         """Create a new SDR with the given dimensions.
 
@@ -59,13 +153,18 @@ class SDR:
 
         self.__size: int = prod(int(dim) for dim in self.__dimensions)
 
-        self._dense: sdr_dense_t = [elem_dense(0)] * int(self.__size)
+        self._dense: array = array(DENSE_TYPECODE, bytes(int(self.__size)))
         self._sparse: sdr_sparse_t = []
         self._coordinates: sdr_coordinate_t = [[] for _ in self.__dimensions]
+        self._words: np.ndarray = np.zeros(
+            (int(self.__size) + WORD_BITS - 1) // WORD_BITS, dtype="<u8"
+        )
+        self._dense_list: Optional[sdr_dense_t] = None
 
         self._dense_valid = True
         self._sparse_valid = False
         self._coordinates_valid = False
+        self._words_valid = True
 
         self.__callbacks: List[Optional[sdr_callback_t]] = []
         self.__destroy_callbacks: List[Optional[sdr_callback_t]] = []
@@ -90,6 +189,37 @@ class SDR:
         self._dense_valid = False
         self._sparse_valid = False
         self._coordinates_valid = False
+        self._words_valid = False
+        self._dense_list = None
+
+    def _get_words(self) -> np.ndarray:
+        """Return the packed ``uint64`` words, packing them from dense or sparse data if stale.
+
+        Setters call this before returning, so the words are normally already current.
+        """
+        if not self._words_valid:
+            if self._dense_valid:
+                self._words = _pack_bits(self._dense_array(), self.__size, sparse=False)
+            else:
+                self._words = _pack_bits(self.get_sparse(), self.__size, sparse=True)
+            self._words_valid = True
+        return self._words
+
+    def _get_dense_buffer(self) -> array:
+        """Return the backing dense buffer, unpacking it from the words if stale."""
+        if not self._dense_valid:
+            if self._words_valid:
+                bits = _unpack_bits(self._words, self.__size)
+            else:
+                bits = np.zeros(int(self.__size), dtype=np.uint8)
+                bits[np.asarray(self.get_sparse(), dtype=np.intp)] = 1
+            self._dense = array(DENSE_TYPECODE, bits.tobytes())
+            self._dense_valid = True
+        return self._dense
+
+    def _dense_array(self) -> np.ndarray:
+        """Return a zero-copy ``uint8`` view of the dense buffer."""
+        return np.frombuffer(self._get_dense_buffer(), dtype=np.uint8)
 
     def do_callbacks(self) -> None:
         """Notify registered watchers that the SDR value has changed."""
@@ -104,16 +234,33 @@ class SDR:
     def set_dense_inplace(self) -> None:
         """Mark the dense buffer as authoritative after in-place edits.
 
-        Verifies the dense array size, coerces values into ``elem_dense``, and
-        invalidates cached sparse/coordinate views before notifying callbacks.
+        Verifies the dense array size, coerces a replaced buffer back into a
+        byte ``array``, and invalidates cached sparse/coordinate views before
+        notifying callbacks.
         """
 
         assert len(self._dense) == int(self.__size), "Dense buffer size does not match SDR size."
 
-        self._dense = [elem_dense(int(val)) for val in self._dense]
+        if not isinstance(self._dense, array):
+            self._dense = array(DENSE_TYPECODE, (elem_dense(int(val)) for val in self._dense))
 
         self.clear()
         self._dense_valid = True
+        self._get_words()
+        self.do_callbacks()
+
+    def _set_words(self, words: np.ndarray) -> None:
+        """Replace the packed words and refresh the sparse buffer from them.
+
+        The sparse buffer is filled eagerly so that callers who edit ``_sparse``
+        and then call :meth:`set_sparse_inplace` start from the current bits;
+        dense and coordinate views are unpacked lazily on their next read.
+        """
+        self.clear()
+        self._words = words
+        self._words_valid = True
+        self._sparse = _sparse_from_words(words)
+        self._sparse_valid = True
         self.do_callbacks()
 
     def set_sparse_inplace(self) -> None:
@@ -140,6 +287,7 @@ class SDR:
 
         self.clear()
         self._sparse_valid = True
+        self._get_words()
         self.do_callbacks()
 
     def set_coordinates_inplace(self) -> None:
@@ -169,6 +317,7 @@ class SDR:
 
         self.clear()
         self._coordinates_valid = True
+        self._get_words()
         self.do_callbacks()
 
     # ------------------------------------------------------------------
@@ -178,7 +327,8 @@ class SDR:
         """Reset the SDR to an empty state and fire destroy callbacks."""
 
         self.clear()
-        self._dense.clear()
+        self._dense = array(DENSE_TYPECODE)
+        self._words = np.zeros(0, dtype="<u8")
         self._sparse.clear()
         self._coordinates.clear()
         self.__size = 0
@@ -191,6 +341,36 @@ class SDR:
         self.__callbacks.clear()
         self.__destroy_callbacks.clear()
 
+    def clone(self) -> "SDR":
+        """Return an independent copy of this SDR's shape and value.
+
+        Copies the cached views and their validity flags directly instead of
+        going through the generic deepcopy machinery. Callbacks are not
+        copied; the clone starts with none registered.
+        """
+        new = SDR.__new__(SDR)
+        new.__dimensions = list(self.__dimensions)
+        new.__size = self.__size
+
+        new._dense = array(DENSE_TYPECODE, self._dense)
+        new._sparse = list(self._sparse)
+        new._coordinates = [list(vec) for vec in self._coordinates]
+        new._words = self._words.copy()
+        new._dense_list = None
+
+        new._dense_valid = self._dense_valid
+        new._sparse_valid = self._sparse_valid
+        new._coordinates_valid = self._coordinates_valid
+        new._words_valid = self._words_valid
+
+        new.__callbacks = []
+        new.__destroy_callbacks = []
+        return new
+
+    def __deepcopy__(self, memo: dict) -> "SDR":
+        """Route ``copy.deepcopy`` through :meth:`clone`."""
+        return self.clone()
+
     # ------------------------------------------------------------------
     # Dimension helpers
     # ------------------------------------------------------------------
@@ -222,35 +402,60 @@ class SDR:
     # ------------------------------------------------------------------
     def zero(self) -> None:
         """Clear all active bits, reset caches, and mark the dense buffer canonical."""
-        self._dense = [elem_dense(0)] * int(self.__size)
+        self._dense = array(DENSE_TYPECODE, bytes(int(self.__size)))
         self._sparse = []
         self._coordinates = [[] for _ in self.__dimensions]
+        self._words = np.zeros_like(self._words)
 
         self.clear()
         self._dense_valid = True
+        self._sparse_valid = True
+        self._words_valid = True
         self.do_callbacks()
 
     def set_dense(self, dense: Iterable[int]) -> None:
-        """Replace contents with a dense iterable after validating its length."""
-        dense_list = list(dense)
-        assert len(dense_list) == int(
-            self.__size
-        ), "Input dense array size does not match SDR size."
-
-        temp = [elem_dense(int(val)) for val in dense_list]
-        self._dense, temp = temp, self._dense
-        self.set_dense_inplace()
+        """Replace contents with a dense iterable after validating its length.
+
+        The input is converted to an array once; the packed words and the sparse
+        view are derived from it so dense, sparse, and words are valid on return.
+        """
+        if isinstance(dense, (list, tuple, array, np.ndarray)):
+            bits = np.asarray(dense)
+        else:
+            bits = np.fromiter(dense, dtype=np.int64)
+        assert bits.shape == (int(self.__size),), "Input dense array size does not match SDR size."
+
+        bits = bits.astype(np.uint8)
+        self._dense = array(DENSE_TYPECODE, bits.tobytes())
+        sparse = np.flatnonzero(bits).tolist()
+
+        self.clear()
+        self._dense_valid = True
+        self._sparse = sparse
+        self._sparse_valid = True
+        self._words = _pack_bits(bits, self.__size, sparse=False)
+        self._words_valid = True
+        self.do_callbacks()
 
     def get_dense(self) -> sdr_dense_t:
-        """Return the dense representation, materialising it from sparse data if required."""
-        if not self._dense_valid:
-            if not self._sparse_valid:
-                self.get_sparse()
-            self._dense = [elem_dense(0)] * int(self.__size)
-            for index in self._sparse:
-                self._dense[int(index)] = elem_dense(1)
-            self._dense_valid = True
-        return self._dense
+        """Return the dense representation as a list, materialising it from sparse data if required.
+
+        The list is built once per value and handed back on every later call
+        until the SDR changes. It is read-only, so writing to it raises
+        ``TypeError``; edit ``_dense`` and call :meth:`set_dense_inplace`, or
+        use :meth:`set_dense`, to modify the SDR.
+        """
+        if self._dense_list is None:
+            self._dense_list = _ReadOnlyList(self._get_dense_buffer().tolist())
+        return self._dense_list
+
+    def get_dense_array(self) -> np.ndarray:
+        """Return the dense bits as a new ``uint8`` array shaped like the SDR.
+
+        The array is unpacked straight from the packed words, so no Python list is
+        built; it is a copy and writing to it does not change the SDR.
+        """
+        return _unpack_bits(self._get_words(), self.__size).reshape(self.__dimensions)
 
     def at_byte(self, coordinates: Sequence[int]) -> int:
         """Return the value stored at the provided multidimensional coordinate.
@@ -268,7 +473,7 @@ class SDR:
             assert int(coord) < int(dim_size), "Coordinate out of bounds."
             flat_index += int(coord) * stride
             stride *= int(dim_size)
-        return self.get_dense()[flat_index]
+        return self._get_dense_buffer()[flat_index]
 
     def set_sparse(self, sparse: Iterable[int]) -> None:
         """Replace the SDR contents with sparse indices and recompute caches."""
@@ -276,26 +481,18 @@ class SDR:
         self.set_sparse_inplace()
 
     def get_sparse(self) -> sdr_sparse_t:
-        """Return sparse indices, creating them from dense or coordinate caches as needed."""
+        """Return sparse indices, unpacking them from the words (or another cache) as needed."""
         if not self._sparse_valid:
             if self._dense_valid:
-                self._sparse = [
-                    elem_sparse(idx) for idx, value in enumerate(self._dense) if int(value) != 0
-                ]
+                self._sparse = np.flatnonzero(self._dense_array()).tolist()
+            elif self._words_valid:
+                self._sparse = _sparse_from_words(self._words)
             elif self._coordinates_valid:
-                self._sparse = []
-                length = len(self._coordinates[0]) if self._coordinates else 0
-                for idx in range(length):
-                    flat_index = 0
-                    stride = 1
-                    for dim_idx in range(len(self.__dimensions) - 1, -1, -1):
-                        coord = self._coordinates[dim_idx][idx]
-                        flat_index += int(coord) * stride
-                        stride *= int(self.__dimensions[dim_idx])
-                    self._sparse.append(elem_sparse(flat_index))
+                coords = tuple(np.asarray(vec, dtype=np.intp) for vec in self._coordinates)
+                flat = np.ravel_multi_index(coords, self.__dimensions)
+                self._sparse = np.sort(flat).tolist()
             else:
                 self._sparse = []
-            self._sparse.sort(key=int)
             self._sparse_valid = True
         return self._sparse
 
@@ -309,17 +506,9 @@ class SDR:
     def get_coordinates(self) -> sdr_coordinate_t:
         """Return coordinate lists, deriving them from the sparse view when stale."""
         if not self._coordinates_valid:
-            for coord in self._coordinates:
-                coord.clear()
-
-            for index in self.get_sparse():
-                flat_index = int(index)
-                for dim in range(len(self.__dimensions) - 1, 0, -1):
-                    dim_size = int(self.__dimensions[dim])
-                    self._coordinates[dim].append(flat_index % dim_size)
-                    flat_index //= dim_size
-                self._coordinates[0].append(flat_index)
-
+            flat = np.asarray(self.get_sparse(), dtype=np.intp)
+            coords = np.unravel_index(flat, self.__dimensions)
+            self._coordinates = [vec.tolist() for vec in coords]
             self._coordinates_valid = True
         return self._coordinates
 
@@ -337,12 +526,18 @@ class SDR:
     # Metrics
     # ------------------------------------------------------------------
     def get_sum(self) -> int:
-        """Return the number of active bits, delegating to the sparse representation."""
-        return len(self.get_sparse())
+        """Return the number of active bits.
+
+        Uses the sparse length when that view is current, otherwise popcounts
+        the packed words instead of materialising a sparse list.
+        """
+        if self._sparse_valid:
+            return len(self._sparse)
+        return _popcount(self._get_words())
 
     def get_sparsity(self) -> float:
         """Return the fraction of active bits relative to the configured size."""
-        return len(self.get_sparse()) / float(int(self.__size))
+        return self.get_sum() / float(int(self.__size))
 
     def get_overlap(self, other: "SDR") -> int:
         """Compute the overlap between this SDR and another with matching dimensions.
@@ -360,9 +555,13 @@ class SDR:
             self.__dimensions == other.get_dimensions()
         ), "SDRs must have matching dimensions to compute overlap."
 
-        self_sparse = set(map(int, self.get_sparse()))
-        other_sparse = set(map(int, other.get_sparse()))
-        return len(self_sparse & other_sparse)
+        # Small SDRs with current sparse views are cheaper to intersect directly
+        # than to pack; larger ones go through the vectorised popcount.
+        n_words = (int(self.__size) + WORD_BITS - 1) // WORD_BITS
+        if n_words < OVERLAP_MIN_WORDS and self._sparse_valid and other._sparse_valid:
+            return len(set(self._sparse).intersection(other._sparse))
+
+        return _popcount(self._get_words() & other._get_words())
 
     # ------------------------------------------------------------------
     # Boolean operations
@@ -396,14 +595,14 @@ class SDR:
             i += 1
 
         if inplace:
-            dense_buffer = self.get_dense()
+            dense_buffer = self._get_dense_buffer()
         else:
-            dense_buffer = [elem_dense(int(val)) for val in inputs[-1].get_dense()]
+            dense_buffer = array(DENSE_TYPECODE, inputs[-1]._get_dense_buffer())
             self._dense = dense_buffer
             inputs.pop()
 
         for sdr in inputs:
-            data = sdr.get_dense()
+            data = sdr._get_dense_buffer()
             for idx, val in enumerate(data):
                 dense_buffer[idx] = elem_dense(1 if int(dense_buffer[idx]) and int(val) else 0)
 
@@ -454,14 +653,14 @@ class SDR:
             i += 1
 
         if inplace:
-            dense_buffer = self.get_dense()
+            dense_buffer = self._get_dense_buffer()
         else:
-            dense_buffer = [elem_dense(int(val)) for val in inputs[-1].get_dense()]
+            dense_buffer = array(DENSE_TYPECODE, inputs[-1]._get_dense_buffer())
             self._dense = dense_buffer
             inputs.pop()
 
         for sdr in inputs:
-            data = sdr.get_dense()
+            data = sdr._get_dense_buffer()
             for idx, val in enumerate(data):
                 dense_buffer[idx] = elem_dense(1 if int(dense_buffer[idx]) or int(val) else 0)
 
@@ -489,31 +688,10 @@ class SDR:
             self.__dimensions[axis_index]
         ), "Concatenation axis dimensions do not sum to output size."
 
-        buffers = [list(sdr.get_dense()) for sdr in inputs]
-        row_lengths: List[int] = []
-        for sdr in inputs:
-            row = 1
-            dims = sdr.get_dimensions()
-            for dim_idx in range(axis_index, len(dims)):
-                row *= int(dims[dim_idx])
-            row_lengths.append(row)
-
-        total_size = int(self.__size)
-        self._dense = [elem_dense(0)] * total_size
-        positions = [0] * len(inputs)
-        out_pos = 0
-
-        while out_pos < total_size:
-            for buf_idx, buf in enumerate(buffers):
-                row = row_lengths[buf_idx]
-                start = positions[buf_idx]
-                end = start + row
-                for value in buf[start:end]:
-                    self._dense[out_pos] = elem_dense(int(value))
-                    out_pos += 1
-                positions[buf_idx] = end
-
-        self.set_dense_inplace()
+        # Viewing each input as an array of its own shape lets NumPy interleave the
+        # rows for any axis in one copy, instead of walking the buffers bit by bit.
+        arrays = [sdr._dense_array().reshape(sdr.get_dimensions()) for sdr in inputs]
+        self.set_dense(np.concatenate(arrays, axis=axis_index).ravel())
 
     # ------------------------------------------------------------------
     # Callbacks
@@ -589,24 +767,26 @@ class SDR:
     # ------------------------------------------------------------------
     # Randomised operations
     # ------------------------------------------------------------------
-    def randomize(self, sparsity: float, rng: Optional[random.Random] = None) -> None:
-        """Populate the SDR with random active bits drawn at the requested sparsity."""
+    def randomize(self, sparsity: float, rng: Optional[sdr_rng_t] = None) -> None:
+        """Populate the SDR with random active bits drawn at the requested sparsity.
+
+        ``rng`` may be a NumPy ``Generator`` or a ``random.Random``; without one the
+        class-wide :attr:`_default_rng` is used, so no generator is seeded per call.
+        """
         assert 0.0 <= sparsity <= 1.0, "Sparsity must be within [0, 1]."
 
         size = int(self.__size)
         nbits = max(0, min(size, int(round(size * float(sparsity)))))
-        rng = rng or random.Random(0)
+        rng = self._default_rng if rng is None else rng
 
-        if nbits:
-            selected = sorted(rng.sample(range(size), nbits))
-        else:
-            selected = []
+        selected = _sample(rng, range(size), nbits) if nbits else []
+        self._set_words(_pack_bits(selected, size, sparse=True))
 
-        self._sparse = [elem_sparse(idx) for idx in selected]
-        self.set_sparse_inplace()
+    def add_noise(self, fraction_noise: float, rng: Optional[sdr_rng_t] = None) -> None:
+        """Stochastically move active bits while preserving the overall sparsity.
 
-    def add_noise(self, fraction_noise: float, rng: Optional[random.Random] = None) -> None:
-        """Stochastically move active bits while preserving the overall sparsity."""
+        Accepts the same ``rng`` types as :meth:`randomize`, with the same default.
+        """
         assert 0.0 <= fraction_noise <= 1.0, "Noise fraction must be within [0, 1]."
         assert (
             1.0 + fraction_noise
@@ -616,23 +796,20 @@ class SDR:
         if num_move_bits == 0:
             return
 
-        rng = rng or random.Random()
+        rng = self._default_rng if rng is None else rng
 
-        sparse_values = list(map(int, self.get_sparse()))
+        size = int(self.__size)
+        words = self._get_words()
+        sparse_values = list(self.get_sparse())
         assert len(sparse_values) >= num_move_bits, "Not enough active bits to turn off."
-        turn_off = rng.sample(sparse_values, num_move_bits)
+        turn_off = _sample(rng, sparse_values, num_move_bits)
 
-        dense = self.get_dense()
-        off_population = [idx for idx in range(int(self.__size)) if int(dense[idx]) == 0]
+        off_population = np.flatnonzero(_unpack_bits(words, size) == 0).tolist()
         assert len(off_population) >= num_move_bits, "Not enough inactive bits to turn on."
-        turn_on = rng.sample(off_population, num_move_bits)
+        turn_on = _sample(rng, off_population, num_move_bits)
 
-        for idx in turn_on:
-            dense[idx] = elem_dense(1)
-        for idx in turn_off:
-            dense[idx] = elem_dense(0)
-
-        self.set_dense_inplace()
+        # Every moved bit flips exactly once, so both moves are one XOR over the words.
+        self._set_words(words ^ _pack_bits(turn_off + turn_on, size, sparse=True))
 
     def kill_cells(self, fraction: float, seed: int = 0) -> None:
         """Deactivate a random subset of bits, seeded for deterministic selection."""
@@ -643,35 +820,29 @@ class SDR:
             return
 
         rng = random.Random(int(seed))
-        dense = self.get_dense()
-        indices = list(range(size))
-        to_kill = rng.sample(indices, nkill)
-
-        for idx in to_kill:
-            dense[idx] = elem_dense(0)
+        to_kill = rng.sample(range(size), nkill)
 
-        self.set_dense(int(val) for val in dense)
+        self._set_words(self._get_words() & ~_pack_bits(to_kill, size, sparse=True))
 
     # ------------------------------------------------------------------
     # Comparison
     # ------------------------------------------------------------------
     def __eq__(self, other: object) -> bool:
-        """Return ``True`` when both SDRs share shape and identical dense content."""
+        """Return ``True`` when both SDRs share shape and identical active bits.
+
+        The packed words are authoritative, so after the shape check this is a
+        single bulk ``np.array_equal`` over them.
+        """
         if not isinstance(other, SDR):
             return NotImplemented
 
-        if len(self.__dimensions) != len(other.__dimensions):
+        if self.__size != other.__size or self.__dimensions != other.__dimensions:
             return False
-        for left, right in zip(self.__dimensions, other.__dimensions):
-            if int(left) != int(right):
-                return False
 
-        dense_self = self.get_dense()
-        dense_other = other.get_dense()
-        if len(dense_self) != len(dense_other):
-            return False
+        return bool(np.array_equal(self._get_words(), other._get_words()))
 
-        return all(int(a) == int(b) for a, b in zip(dense_self, dense_other))
+    # SDRs are mutable, so equal SDRs cannot promise a stable hash.
+    __hash__ = None  # type: ignore[assignment]
 
     def __repr__(self) -> str:
         """Return a concise, developer-friendly summary of the SDR state."""
@@ -0,0 +1,41 @@
+"""Shared pytest fixtures for the test suite."""
+
+import os
+import random
+import re
+
+import numpy as np
+import pytest
+
+from psu_capstone.encoder_layer import rdse
+from psu_capstone.encoder_layer.sdr import SDR
+
+
+def _visual_requested(config: pytest.Config) -> bool:
+    """True when the mark expression asks for the visual tests, e.g. ``-m visual``."""
+    return re.search(r"(?<!not )\bvisual\b", config.getoption("markexpr")) is not None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Render Matplotlib off-screen unless the visual tests were asked for explicitly."""
+    config.addinivalue_line("markers", "visual: draws SDRs; shown on screen with -m visual")
+    if not _visual_requested(config):
+        os.environ.setdefault("MPLBACKEND", "Agg")
+
+
+@pytest.fixture
+def show_figures(pytestconfig: pytest.Config) -> bool:
+    """Whether visual tests should open their figures in a window instead of saving a PNG."""
+    return _visual_requested(pytestconfig)
+
+
+@pytest.fixture(autouse=True)
+def deterministic_rdse_seed(monkeypatch: pytest.MonkeyPatch):
+    """Replace the RDSE's seed-0 generator with a seeded one so every test is repeatable."""
+    monkeypatch.setattr(rdse, "_RNG", random.Random(0))
+
+
+@pytest.fixture(autouse=True)
+def deterministic_sdr_rng(monkeypatch: pytest.MonkeyPatch):
+    """Give SDR.randomize and SDR.add_noise a freshly seeded default generator per test."""
+    monkeypatch.setattr(SDR, "_default_rng", np.random.default_rng(0))
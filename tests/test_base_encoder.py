@@ -25,8 +25,5 @@ def test_base_encoder_initialization(base_encoder_instance):
     encoder = base_encoder_instance
 
     # Assert
-    print(encoder.dimensions)
-    print(encoder.size)
-
     assert encoder.dimensions == [10, 10]
     assert encoder.size == 100
@@ -1,16 +1,38 @@
 """Test suite for the Category Encoder"""
 
+import numpy as np
 import pytest
 
 from psu_capstone.encoder_layer.category_encoder import CategoryEncoder, CategoryParameters
 from psu_capstone.encoder_layer.sdr import SDR
 
+# Expected dense outputs for the width one encoder, one row per category. Since width is 1,
+# each category is 1 bit and the first bit is the unknown category.
+EXPECTED_W1 = np.array(
+    [
+        [0, 1, 0, 0, 0, 0],
+        [0, 0, 1, 0, 0, 0],
+        [0, 0, 0, 1, 0, 0],
+        [0, 0, 0, 0, 1, 0],
+        [0, 0, 0, 0, 0, 1],
+    ],
+    dtype=np.uint8,
+)
 
-@pytest.fixture
-def category_instance():
-    """Fixture to create a Category encoder instance for tests
-    This is used for teardown purposes if needed in the future.
-    """
+
+@pytest.fixture(scope="module")
+def us_gb_es_encoder():
+    """Scalar backed encoder for the ES/GB/US categories, shared by the tests in this module."""
+    parameters = CategoryParameters(w=3, category_list=["ES", "GB", "US"], rdse_used=False)
+    return CategoryEncoder(parameters=parameters)
+
+
+@pytest.fixture(scope="module")
+def width_one_encoder():
+    """Scalar backed encoder for five categories with a width of a single bit."""
+    categories = ["cat1", "cat2", "cat3", "cat4", "cat5"]
+    parameters = CategoryParameters(w=1, category_list=categories, rdse_used=False)
+    return CategoryEncoder(parameters=parameters)
 
 
 def test_category_initialization():
@@ -26,67 +48,52 @@ def test_category_initialization():
     """Checking if the instance is correct."""
 
 
-def test_encode_us():
+def test_encode_us(us_gb_es_encoder):
     """
     This encodes the category "US" into an SDR of 1x12. That bit number is determined from
     3 categories and 1 unknown category. This is w or width of 3 times 4 which is 12 long.
     """
-    categories = ["ES", "GB", "US"]
-    parameters = CategoryParameters(w=3, category_list=categories, rdse_used=False)
-    e = CategoryEncoder(parameters=parameters)
+    e = us_gb_es_encoder
     a = SDR([1, 12])
     e.encode("US", a)
     """This makes sure our encoding is accurate and matches a known SDR outcome."""
     assert a.get_dense() == [0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1]
 
 
-def test_unknown_category():
+def test_unknown_category(us_gb_es_encoder):
     """
     This encodes an unknown category. Here we use "NA" which as you can see is not one of
     the categories specified.
     """
-    categories = ["ES", "GB", "US"]
-    parameters = CategoryParameters(w=3, category_list=categories, rdse_used=False)
-    e = CategoryEncoder(parameters=parameters)
+    e = us_gb_es_encoder
     a = SDR([1, 12])
     e.encode("NA", a)
     """This makes sure our encoding is accurate and matches a known SDR outcome."""
     assert a.get_dense() == [1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 
 
-def test_encode_es():
+def test_encode_es(us_gb_es_encoder):
     """
     This is almost idential to the "US" encoding, I am just deomonstrating that the encoding
     shows different active bits for different categories.
     """
-    categories = ["ES", "GB", "US"]
-    parameters = CategoryParameters(w=3, category_list=categories, rdse_used=False)
-    e = CategoryEncoder(parameters=parameters)
+    e = us_gb_es_encoder
     a = SDR([1, 12])
     e.encode("ES", a)
     """This makes sure our encoding is accurate and matches a known SDR outcome."""
     assert a.get_dense() == [0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0]
 
 
-def test_with_width_one():
+def test_with_width_one(width_one_encoder):
     """This test is used to show how SDR outputs look with a single w or width."""
     categories = ["cat1", "cat2", "cat3", "cat4", "cat5"]
-    """Note: I think since width is 1, each category is 1 bit and there is the first bit that is the unknown category."""
-    expected = [
-        [0, 1, 0, 0, 0, 0],
-        [0, 0, 1, 0, 0, 0],
-        [0, 0, 0, 1, 0, 0],
-        [0, 0, 0, 0, 1, 0],
-        [0, 0, 0, 0, 0, 1],
-    ]
-    parameters = CategoryParameters(w=1, category_list=categories, rdse_used=False)
-    e = CategoryEncoder(parameters=parameters)
+    e = width_one_encoder
     i = 0
     """The respective category should equal their index of expected results."""
     for cat in categories:
         a = SDR([1, 6])
         e.encode(cat, a)
-        assert a.get_dense() == expected[i]
+        np.testing.assert_array_equal(a.get_dense(), EXPECTED_W1[i])
         i = i + 1
 
 
@@ -114,3 +121,40 @@ def test_rdse_used():
     e1.encode("NA", a1)
     e1.encode("NA", a2)
     assert a1.get_dense() == a2.get_dense()
+
+
+def test_repeated_encode_uses_cache():
+    """
+    Encoding the same category again with the RDSE backed encoder should come from the
+    cache and match the first encoding.
+    """
+    categories = ["ES", "GB", "US"]
+    parameters = CategoryParameters(w=3, category_list=categories)
+    e = CategoryEncoder(parameters=parameters)
+    a1 = SDR([1, 12])
+    a2 = SDR([1, 12])
+    e.encode("GB", a1)
+    e.encode("NA", a2)
+    e.encode("GB", a2)
+    """Unknown categories share index 0, so the cache holds one entry per index."""
+    e.encode("XX", a1)
+    e.encode("GB", a1)
+    assert a1.get_sparse() == a2.get_sparse()
+    assert len(e._cache) == 2
+
+
+def test_lookup_table_matches_scalar_encoder():
+    """
+    The non-RDSE path reads its bits from a lookup table built at construction. This checks
+    every row against the inner scalar encoder for a few widths.
+    """
+    categories = ["cat1", "cat2", "cat3", "cat4", "cat5"]
+    for w in (1, 3, 7):
+        parameters = CategoryParameters(w=w, category_list=categories, rdse_used=False)
+        e = CategoryEncoder(parameters=parameters)
+        a = SDR([e.size])
+        b = SDR([e.size])
+        for cat in ["unknown"] + categories:
+            e.encode(cat, a)
+            e.encoder.encode(float(e._idx.get(cat, 0)), b)
+            assert a.get_sparse() == b.get_sparse()
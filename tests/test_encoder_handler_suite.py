@@ -1,9 +1,11 @@
 """Test cases for EncoderHandler to build union SDRs"""
 
 import copy
+import logging
 from datetime import datetime
 from typing import List
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -45,6 +47,7 @@ def test_handler_singleton(handler: EncoderHandler):
 
     # Assert
     assert h1 is h2
+    assert h2._data_frame is test_input  # not re-initialized on later constructions
 
 
 def test_copy_deepcopy_sdr(handler: EncoderHandler):
@@ -52,7 +55,7 @@ def test_copy_deepcopy_sdr(handler: EncoderHandler):
 
     # Arrange
     test_data = handler._data_frame
-    rows = test_data.iloc[0]
+    row = test_data.iloc[:1].to_numpy(dtype=object)[0]
     sdrs = []
 
     # Act
@@ -60,7 +63,7 @@ def test_copy_deepcopy_sdr(handler: EncoderHandler):
 
     # Assert that a deep copy occurs
     for i, encoder in enumerate(handler._encoders):
-        input_value = rows.iloc[i]
+        input_value = row[i]
 
         output_sdr = SDR([encoder.size])
 
@@ -80,3 +83,119 @@ def test_copy_deepcopy_sdr(handler: EncoderHandler):
         assert sdrs[i].get_sparse() != []
         output_sdr.zero()
         assert sdrs[i].get_sparse() != output_sdr.get_sparse()
+
+
+def test_composite_sdr_offsets(handler: EncoderHandler):
+    """Test that the composite SDR places each column's bits after the previous columns"""
+
+    # Arrange
+    test_data = handler._data_frame
+    row = test_data.iloc[:1].to_numpy(dtype=object)[0]
+
+    # Act
+    composite = handler.build_composite_sdr(test_data)
+
+    # Assert
+    expected: List[int] = []
+    offset = 0
+    for i, encoder in enumerate(handler._encoders):
+        output_sdr = SDR([encoder.size])
+        encoder.encode(row[i], output_sdr)
+        expected.extend(idx + offset for idx in output_sdr.get_sparse())
+        offset += encoder.size
+
+    assert composite.size == offset
+    assert composite.get_sparse() == expected
+
+
+def test_build_composite_dense_rows(handler: EncoderHandler):
+    """Test that each dense composite row matches encoding that row column by column"""
+
+    # Arrange
+    test_data = pd.DataFrame(
+        {
+            "float_col": [3.14, 27.5, 80.0],
+            "int_col": [25, 75, 100],
+            "str_col": ["A", "B", "A"],
+            "date_col": [datetime(2023, 12, 25), datetime(2024, 7, 4, 14), datetime(2020, 1, 1)],
+        }
+    )
+
+    # Act
+    dense = handler.build_composite_dense(test_data)
+    values = test_data.to_numpy(dtype=object)
+
+    # Assert
+    sizes = [encoder.size for encoder in handler._encoders]
+    assert dense.shape == (len(test_data), sum(sizes))
+    for r in range(len(test_data)):
+        offset = 0
+        for c, encoder in enumerate(handler._encoders):
+            output_sdr = SDR([encoder.size])
+            encoder.encode(values[r, c], output_sdr)
+            block = dense[r, offset : offset + encoder.size]
+            assert np.flatnonzero(block).tolist() == output_sdr.get_sparse()
+            offset += encoder.size
+
+
+def test_build_composite_dense_matches_composite_sdr(handler: EncoderHandler):
+    """Test that dense and SDR composites skip the same columns and agree on the first row"""
+
+    # Arrange
+    test_data = pd.DataFrame({"a": [np.nan, 2.5], "b": [1, 5]})
+
+    # Act
+    composite_sdr = handler.build_composite_sdr(test_data)
+    sdr_encoders = list(handler._encoders)
+    dense = handler.build_composite_dense(test_data)
+
+    # Assert
+    assert [type(encoder) for encoder in handler._encoders] == [
+        type(encoder) for encoder in sdr_encoders
+    ]
+    assert dense.shape == (len(test_data), composite_sdr.size)
+    assert np.flatnonzero(dense[0]).tolist() == composite_sdr.get_sparse()
+
+
+def test_composite_sdr_logs_columns(handler: EncoderHandler, caplog: pytest.LogCaptureFixture):
+    """Test that per-column encodings are reported through logging rather than stdout"""
+
+    # Arrange
+    test_data = handler._data_frame
+
+    # Act
+    with caplog.at_level(logging.DEBUG, logger="psu_capstone.encoder_layer.encoder_handler"):
+        handler.build_composite_sdr(test_data)
+
+    # Assert
+    logged = [record.getMessage() for record in caplog.records]
+    for col_name in test_data.columns:
+        assert any(f"Column '{col_name}'" in message for message in logged)
+
+
+def test_build_composite_dense_groups_scalar_columns(handler: EncoderHandler):
+    """Test that non-adjacent scalar columns encoded as one group land in their own slices"""
+
+    # Arrange
+    test_data = pd.DataFrame(
+        {
+            "int_a": [10, 55, 90],
+            "float_col": [3.14, 27.5, 80.0],
+            "int_b": [90, 0, 42],
+        }
+    )
+
+    # Act
+    dense = handler.build_composite_dense(test_data)
+    values = test_data.to_numpy(dtype=object)
+
+    # Assert
+    assert handler._by_type[ScalarEncoder] == [0, 2]
+    offset = 0
+    for c, encoder in enumerate(handler._encoders):
+        block = dense[:, offset : offset + encoder.size]
+        for r in range(len(test_data)):
+            output_sdr = SDR([encoder.size])
+            encoder.encode(values[r, c], output_sdr)
+            assert np.flatnonzero(block[r]).tolist() == output_sdr.get_sparse()
+        offset += encoder.size
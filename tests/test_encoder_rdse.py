@@ -1,58 +1,50 @@
 """Test suite for the RDSE."""
 
+from dataclasses import replace
+
 import pytest
 
+from psu_capstone.encoder_layer import rdse
 from psu_capstone.encoder_layer.rdse import RandomDistributedScalarEncoder, RDSEParameters
 from psu_capstone.encoder_layer.sdr import SDR
 
 
-@pytest.fixture
-def rdse_instance():
-    """Fixture to create an RDSE instance for tests."""
-
-
-def test_rdse_initialization():
-    """Test the initialization of the RDSE."""
-
-    parameters = RDSEParameters(
+@pytest.fixture(scope="module")
+def base_rdse_params() -> RDSEParameters:
+    """Shared RDSE parameters. The encoder deep copies its parameters, so tests that need
+    different fields derive their own copy with dataclasses.replace instead of mutating this."""
+    return RDSEParameters(
         size=1000, active_bits=0, sparsity=0.05, radius=0.0, resolution=1.23, category=False, seed=0
     )
 
-    encoder = RandomDistributedScalarEncoder(parameters, [1, 1000])
-    """Makes sure it is the correct instance"""
-    assert isinstance(encoder, RandomDistributedScalarEncoder)
 
+@pytest.fixture(scope="module")
+def default_encoder(base_rdse_params) -> RandomDistributedScalarEncoder:
+    """One RDSE built from the shared parameters, for tests that only read its attributes."""
+    return RandomDistributedScalarEncoder(base_rdse_params, [1, 1000])
 
-def test_size():
-    """Test to make sure the encoder size is correct."""
-    parameters = RDSEParameters(
-        size=1000, active_bits=0, sparsity=0.05, radius=0.0, resolution=1.23, category=False, seed=0
-    )
 
-    encoder = RandomDistributedScalarEncoder(parameters, [1, 1000])
-    """Checks that the size is correct."""
-    assert encoder._size == 1000
+def test_rdse_initialization(default_encoder):
+    """Test the initialization of the RDSE."""
 
+    """Makes sure it is the correct instance"""
+    assert isinstance(default_encoder, RandomDistributedScalarEncoder)
 
-def test_dimensions():
-    """Test to make sure the encoder dimensions is correct."""
-    parameters = RDSEParameters(
-        size=1000, active_bits=0, sparsity=0.05, radius=0.0, resolution=1.23, category=False, seed=0
-    )
 
-    encoder = RandomDistributedScalarEncoder(parameters, [1, 1000])
-    RandomDistributedScalarEncoder(parameters, [1, 1000])
-    """Checks that the dimensions are correct in the encoder."""
-    assert encoder.dimensions == [1, 1000]
+@pytest.mark.parametrize(
+    "attr, expected",
+    [("_size", 1000), ("size", 1000), ("_resolution", 1.23), ("dimensions", [1, 1000])],
+)
+def test_encoder_attr(default_encoder, attr, expected):
+    """Checks that the size, resolution, and dimensions are correct in the encoder."""
+    assert getattr(default_encoder, attr) == expected
 
 
-def test_encode_active_bits():
+def test_encode_active_bits(base_rdse_params):
     """Checks to make sure the proper active bit range is set, the density of the SDR is correct,
     and the size plus dimensions are correct for the SDR after the RDSE encodes it.
     """
-    parameters = RDSEParameters(
-        size=1000, active_bits=50, sparsity=0.0, radius=0.0, resolution=1.5, category=False, seed=0
-    )
+    parameters = replace(base_rdse_params, active_bits=50, sparsity=0.0, resolution=1.5)
     encoder = RandomDistributedScalarEncoder(parameters, [1, 1000])
     a = SDR(encoder.dimensions)
     encoder.encode(10, a)
@@ -70,12 +62,10 @@ def test_encode_active_bits():
     assert dense_size == 1000
 
 
-def test_resolution_plus_radius_plus_category():
+def test_resolution_plus_radius_plus_category(base_rdse_params):
     """This makes sure proper safe-guards are raised when multiple parameters are entered
     that should not be entered together."""
-    parameters = RDSEParameters(
-        size=1000, active_bits=50, sparsity=0.0, radius=1.0, resolution=1.5, category=False, seed=0
-    )
+    parameters = replace(base_rdse_params, active_bits=50, sparsity=0.0, radius=1.0, resolution=1.5)
     """
     Make sure an exception is thrown here since these parameters should
     not be used together.
@@ -90,11 +80,9 @@ def test_resolution_plus_radius_plus_category():
         RandomDistributedScalarEncoder(parameters, [1, 1000])
 
 
-def test_sparsity_or_activebits():
+def test_sparsity_or_activebits(base_rdse_params):
     """This makes sure that eitehr sparsity or active bits are entered and not both."""
-    parameters = RDSEParameters(
-        size=1000, active_bits=50, sparsity=1.0, radius=0.0, resolution=1.5, category=False, seed=0
-    )
+    parameters = replace(base_rdse_params, active_bits=50, sparsity=1.0, resolution=1.5)
     """Make sure an exception is thrown here since both sparsity and active bits are set."""
     with pytest.raises(Exception):
         RandomDistributedScalarEncoder(parameters, [1, 1000])
@@ -106,21 +94,36 @@ def test_sparsity_or_activebits():
     RandomDistributedScalarEncoder(parameters, [1, 1000])
 
 
-def test_one_of_resolution_radius_category_should_be_entered():
+def test_one_of_resolution_radius_category_should_be_entered(base_rdse_params):
     """We need exactly one of these parameters set otherwise it should return an exception."""
-    parameters = RDSEParameters(
-        size=1000, active_bits=50, sparsity=1.0, radius=0.0, resolution=0.0, category=False, seed=0
-    )
+    parameters = replace(base_rdse_params, active_bits=50, sparsity=1.0, resolution=0.0)
     """Make sure an exception is thrown here since neither radius, resolution, or category were entered."""
     with pytest.raises(Exception):
         RandomDistributedScalarEncoder(parameters, [1, 1000])
 
 
-def test_one_of_activebit_or_sparsity_is_entered():
+def test_one_of_activebit_or_sparsity_is_entered(base_rdse_params):
     """We need exactly one of these parameters set otherwise it should return an exception."""
-    parameters = RDSEParameters(
-        size=1000, active_bits=0, sparsity=0.0, radius=1.0, resolution=0.0, category=False, seed=0
-    )
+    parameters = replace(base_rdse_params, sparsity=0.0, radius=1.0, resolution=0.0)
     """Make sure an exception is thrown here since neither active bits or sparsity was entered"""
     with pytest.raises(Exception):
         RandomDistributedScalarEncoder(parameters, [1, 1000])
+
+
+def test_bucket_cache_reuse_and_cap(base_rdse_params, monkeypatch):
+    """Repeated values come from the per-bucket cache, which never grows past its cap."""
+    monkeypatch.setattr(rdse, "BUCKET_CACHE_SIZE", 2)
+    parameters = replace(base_rdse_params, active_bits=50, sparsity=0.0, resolution=1.5)
+    encoder = RandomDistributedScalarEncoder(parameters, [1, 1000])
+    a = SDR(encoder.dimensions)
+    b = SDR(encoder.dimensions)
+
+    encoder.encode(10, a)
+    first = a.get_sparse()
+    encoder.encode(20, b)
+    encoder.encode(30, b)
+    encoder.encode(10, b)
+
+    """The value 10 was evicted and re-hashed, so the encoding must be the same as before."""
+    assert b.get_sparse() == first
+    assert len(encoder._bucket_cache) == 2
@@ -1,5 +1,10 @@
 """Test suite for the SDR Encoder-Scalar."""
 
+import functools
+from dataclasses import astuple, replace
+from typing import Dict, List, Tuple
+
+import numpy as np
 import pytest
 
 from psu_capstone.encoder_layer.scalar_encoder import ScalarEncoder, ScalarEncoderParameters
@@ -11,26 +16,132 @@ def scalar_encoder_instance():
     """Fixture to create a ScalarEncoder instance for testing. This may change when we get Union working properly."""
 
 
-# Helper -- may need to be implemented later
-def do_scalar_value_cases(encoder: ScalarEncoder, cases):
-    pass
-
-
-def test_scalar_encoder_initialization():
-    """Test the initialization of the ScalarEncoder."""
-
-    # Arrange
-    parameters = ScalarEncoderParameters(
-        minimum=0.0,
-        maximum=100.0,
-        clip_input=True,
+@pytest.fixture(scope="module")
+def base_scalar_params() -> ScalarEncoderParameters:
+    """Shared parameters for a 10 bit encoder over [10, 20]. The encoder deep copies its
+    parameters, so tests derive variants with dataclasses.replace instead of mutating this."""
+    return ScalarEncoderParameters(
+        minimum=10.0,
+        maximum=20.0,
+        clip_input=False,
         periodic=False,
-        active_bits=5,
+        active_bits=2,
         sparsity=0.0,
         size=10,
         radius=0.0,
-        category=False,
         resolution=0.0,
+        category=False,
+    )
+
+
+@pytest.fixture(scope="module")
+def base_scalar_encoder(base_scalar_params) -> ScalarEncoder:
+    """One [2, 5] encoder over base_scalar_params, shared by the input range tests. encode does
+    not change the encoder's state, so the tests can reuse it."""
+    return ScalarEncoder(base_scalar_params, [2, 5])
+
+
+_RESOLUTION_PARAMS = ScalarEncoderParameters(
+    minimum=10.0,
+    maximum=20.0,
+    clip_input=False,
+    periodic=False,
+    active_bits=3,
+    sparsity=0.0,
+    size=0,
+    radius=0.0,
+    category=False,
+    resolution=1,
+)
+
+# Parameters and dimensions of the encoders used by the value-case tests, built once at import.
+_PARAM_SETS: Dict[str, Tuple[ScalarEncoderParameters, List[int]]] = {
+    "bucket_width": (
+        replace(_RESOLUTION_PARAMS, clip_input=True, size=7, resolution=0.0),
+        [1, 7],
+    ),
+    "resolution": (_RESOLUTION_PARAMS, [1, 13]),
+    "periodic": (replace(_RESOLUTION_PARAMS, periodic=True), [1, 10]),
+}
+
+BUCKET_WIDTH_CASES = [
+    (10.0, [0, 1, 2]),
+    (20.0, [4, 5, 6]),
+]
+
+RESOLUTION_CASES = [
+    (10.00, [0, 1, 2]),
+    (10.49, [0, 1, 2]),
+    (10.50, [1, 2, 3]),
+    (11.49, [1, 2, 3]),
+    (11.50, [2, 3, 4]),
+    (14.49, [4, 5, 6]),
+    (14.50, [5, 6, 7]),
+    (15.49, [5, 6, 7]),
+    (15.50, [6, 7, 8]),
+    (19.00, [9, 10, 11]),
+    (19.49, [9, 10, 11]),
+    (19.50, [10, 11, 12]),
+    (20.00, [10, 11, 12]),
+]
+
+PERIODIC_CASES = [
+    (10.00, [0, 1, 2]),
+    (10.49, [0, 1, 2]),
+    (10.50, [1, 2, 3]),
+    (11.49, [1, 2, 3]),
+    (11.50, [2, 3, 4]),
+    (14.49, [4, 5, 6]),
+    (14.50, [5, 6, 7]),
+    (15.49, [5, 6, 7]),
+    (15.50, [6, 7, 8]),
+    (19.49, [9, 0, 1]),
+    (19.50, [0, 1, 2]),
+    (20.00, [0, 1, 2]),
+]
+
+
+def _value_params(cases):
+    """Wrap (value, expected) cases as pytest params with the value as a readable id."""
+    return [pytest.param(value, expected, id=f"{value:.2f}") for value, expected in cases]
+
+
+def encode_sparse(encoder: ScalarEncoder, value: float) -> List[int]:
+    """Encode one value into a fresh SDR and return its active bits."""
+    output = SDR(encoder.dimensions)
+    encoder.encode(value, output)
+    return output.get_sparse()
+
+
+def do_scalar_value_cases(encoder: ScalarEncoder, cases):
+    """Encode each (value, expected active bits) case.
+
+    Every case goes through encode, with one pair of SDRs reused for all of them. Encoders
+    with encode_batch_sparse then also compute every case in one call, compared against the
+    sorted expected bits.
+    """
+    expected_sdr = SDR(encoder.dimensions)
+    actual_sdr = SDR(encoder.dimensions)
+    for input_value, expected_output in cases:
+        expected_sdr.set_sparse(sorted(expected_output))
+        actual_sdr.zero()
+        encoder.encode(input_value, actual_sdr)
+        assert actual_sdr == expected_sdr, f"{input_value}: {actual_sdr.get_sparse()}"
+
+    if hasattr(encoder, "encode_batch_sparse"):
+        values = np.fromiter((value for value, _ in cases), dtype=np.float64, count=len(cases))
+        expected = np.sort([expected_output for _, expected_output in cases], axis=1)
+        active = encoder.encode_batch_sparse(values)
+        mismatched = ~np.all(active == expected, axis=1)
+        assert not mismatched.any(), f"{values[mismatched]}: {active[mismatched].tolist()}"
+
+
+def test_scalar_encoder_initialization(base_scalar_params):
+    """Test the initialization of the ScalarEncoder."""
+
+    # Arrange
+    parameters = replace(
+        base_scalar_params, minimum=0.0, maximum=100.0, clip_input=True, active_bits=5
     )
 
     # Act
@@ -44,24 +155,12 @@ def test_scalar_encoder_initialization():
     assert encoder.dimensions == [1, 10]
 
 
-def test_clipping_inputs():
+def test_clipping_inputs(base_scalar_encoder):
     """Test that inputs are correctly clipped to the specified min/max range."""
 
     # Arrange
-    p = ScalarEncoderParameters(
-        minimum=10.0,
-        maximum=20.0,
-        clip_input=False,
-        periodic=False,
-        active_bits=2,
-        sparsity=0.0,
-        size=10,
-        radius=0.0,
-        resolution=0.0,
-        category=False,
-    )
+    encoder = base_scalar_encoder
     # Act and Assert baseline
-    encoder = ScalarEncoder(p, dimensions=[2, 5])
     test_sdr = SDR([2, 5])
     test_sdr.zero()
 
@@ -79,36 +178,28 @@ def test_clipping_inputs():
 
     with pytest.raises(ValueError):
         encoder.encode(9.9, test_sdr)  # Below minimum edge case
+    with pytest.raises(ValueError):
         encoder.encode(20.1, test_sdr)  # Above maximum edge case
+    with pytest.raises(ValueError, match=r"indices \[0, 2\]"):
+        encoder.encode_batch([9.9, 15.0, 20.1])
 
 
-def test_valid_scalar_inputs():
+def test_valid_scalar_inputs(base_scalar_encoder):
     """Test that valid scalar inputs are encoded correctly."""
 
     # Arrange
-    params = ScalarEncoderParameters(
-        size=10,
-        active_bits=2,
-        minimum=10,
-        maximum=20,
-        sparsity=0.0,
-        radius=0.0,
-        category=False,
-        resolution=0.0,
-        clip_input=False,
-        periodic=False,
-    )
+    encoder = base_scalar_encoder
 
     # Act and Assert - baseline
-    encoder = ScalarEncoder(params, [2, 5])
     test_sdr = SDR([2, 5])
     assert encoder.size == 10
     assert encoder.dimensions == [2, 5]
     assert test_sdr.size == 10
     assert test_sdr.get_sparse() == []
 
-    with pytest.raises(Exception):
+    with pytest.raises(ValueError):
         encoder.encode(9.999, test_sdr)  # Below minimum edge case
+    with pytest.raises(ValueError):
         encoder.encode(20.0001, test_sdr)  # Above maximum edge case
 
     try:
@@ -159,109 +250,71 @@ def test_scalar_encoder_category_encode():
         pytest.fail(f"Unexpected exception raised: {e}")
 
 
-def test_scalar_encoder_non_integer_bucket_width():
-    """Test that scalar encoder handles non-integer bucket widths correctly."""
-    # Arrange
-    params = ScalarEncoderParameters(
-        minimum=10.0,
-        maximum=20.0,
-        clip_input=True,
-        periodic=False,
-        active_bits=3,
-        sparsity=0.0,
-        size=7,
-        radius=0.0,
-        category=False,
-        resolution=0.0,
-    )
+@pytest.fixture(scope="module")
+def case_encoder(request) -> ScalarEncoder:
+    """Module-scoped encoder for the _PARAM_SETS entry named by indirect parametrization."""
+    params, dimensions = _PARAM_SETS[request.param]
+    return ScalarEncoder(params, dimensions)
 
-    encoder = ScalarEncoder(params, [1, 7])
 
-    cases = [
-        (10.0, [0, 1, 2]),
-        (20.0, [4, 5, 6]),
-    ]
+@pytest.mark.parametrize(
+    "case_encoder, size, dimensions",
+    [("bucket_width", 7, [1, 7]), ("resolution", 13, [1, 13]), ("periodic", 10, [1, 10])],
+    indirect=["case_encoder"],
+)
+def test_case_encoder_sizes(case_encoder: ScalarEncoder, size, dimensions):
+    """Baseline sizes for the encoders behind the value-case tests below."""
+    assert case_encoder.size == size
+    assert case_encoder.dimensions == dimensions
 
-    do_scalar_value_cases(encoder, cases)
+
+@pytest.mark.parametrize("case_encoder", ["bucket_width"], indirect=True)
+@pytest.mark.parametrize("value, expected", _value_params(BUCKET_WIDTH_CASES))
+def test_scalar_encoder_non_integer_bucket_width(case_encoder: ScalarEncoder, value, expected):
+    """Test that scalar encoder handles non-integer bucket widths correctly."""
+    assert encode_sparse(case_encoder, value) == sorted(expected)
 
 
-def test_scalar_encoder_round_to_nearest_multiple_of_resolution():
+@pytest.mark.parametrize("case_encoder", ["resolution"], indirect=True)
+@pytest.mark.parametrize("value, expected", _value_params(RESOLUTION_CASES))
+def test_scalar_encoder_round_to_nearest_multiple_of_resolution(
+    case_encoder: ScalarEncoder, value, expected
+):
     """Test that scalar encoder rounds to the nearest multiple of resolution correctly."""
+    assert encode_sparse(case_encoder, value) == sorted(expected)
 
-    # Arrange
-    params = ScalarEncoderParameters(
-        minimum=10.0,
-        maximum=20.0,
-        clip_input=False,
-        periodic=False,
-        active_bits=3,
-        sparsity=0.0,
-        size=0,
-        radius=0.0,
-        category=False,
-        resolution=1,
-    )
 
-    # Act and Assert - baseline
-    encoder = ScalarEncoder(params, dimensions=[1, 13])
-    assert encoder._size == 13
-    assert encoder._dimensions == [1, 13]
-
-    cases = [
-        (10.00, [0, 1, 2]),
-        (10.49, [0, 1, 2]),
-        (10.50, [1, 2, 3]),
-        (11.49, [1, 2, 3]),
-        (11.50, [2, 3, 4]),
-        (14.49, [4, 5, 6]),
-        (14.50, [5, 6, 7]),
-        (15.49, [5, 6, 7]),
-        (15.50, [6, 7, 8]),
-        (19.00, [9, 10, 11]),
-        (19.49, [9, 10, 11]),
-        (19.50, [10, 11, 12]),
-        (20.00, [10, 11, 12]),
-    ]
-
-    do_scalar_value_cases(encoder, cases)
-
-
-def test_scalar_encoder_periodic_round_nearest_multiple_of_resolution():
+@pytest.mark.parametrize("case_encoder", ["periodic"], indirect=True)
+@pytest.mark.parametrize("value, expected", _value_params(PERIODIC_CASES))
+def test_scalar_encoder_periodic_round_nearest_multiple_of_resolution(
+    case_encoder: ScalarEncoder, value, expected
+):
     """Test that periodic scalar encoder rounds to the nearest multiple of resolution correctly."""
-    # Arrange
-    params = ScalarEncoderParameters(
-        minimum=10.0,
-        maximum=20.0,
-        clip_input=False,
-        periodic=True,
-        active_bits=3,
-        sparsity=0.0,
-        size=0,
-        radius=0.0,
-        category=False,
-        resolution=1,
-    )
-    encoder = ScalarEncoder(params, [1, 10])
+    assert encode_sparse(case_encoder, value) == sorted(expected)
 
-    # Act and Assert - baseline
-    assert encoder.size == 10
-    assert encoder.dimensions == [1, 10]
-    cases = [
-        (10.00, [0, 1, 2]),
-        (10.49, [0, 1, 2]),
-        (10.50, [1, 2, 3]),
-        (11.49, [1, 2, 3]),
-        (11.50, [2, 3, 4]),
-        (14.49, [4, 5, 6]),
-        (14.50, [5, 6, 7]),
-        (15.49, [5, 6, 7]),
-        (15.50, [6, 7, 8]),
-        (19.49, [9, 0, 1]),
-        (19.50, [0, 1, 2]),
-        (20.00, [0, 1, 2]),
-    ]
-
-    do_scalar_value_cases(encoder, cases)
+
+@pytest.mark.parametrize(
+    "case_encoder, cases",
+    [
+        ("bucket_width", BUCKET_WIDTH_CASES),
+        ("resolution", RESOLUTION_CASES),
+        ("periodic", PERIODIC_CASES),
+    ],
+    indirect=["case_encoder"],
+)
+def test_scalar_value_tables_in_one_batch(case_encoder: ScalarEncoder, cases):
+    """Test each whole value table through encode and through one encode_batch_sparse call."""
+    do_scalar_value_cases(case_encoder, cases)
+
+
+@functools.lru_cache(maxsize=64)
+def _make_scalar(params_key: Tuple, dimensions: Tuple[int, ...]) -> ScalarEncoder:
+    """Build (once per parameter signature) a ScalarEncoder from an astuple() key.
+
+    The parameters dataclass is mutated by check_parameters, so it cannot be frozen
+    and hashed directly; its field tuple is used as the cache key instead.
+    """
+    return ScalarEncoder(ScalarEncoderParameters(*params_key), list(dimensions))
 
 
 def nearly_equal(a, b, tol=1e-5):
@@ -286,78 +339,18 @@ def test_scalar_encoder_serialization():
         category=False,
         resolution=0.0,
     )
-    inputs.append(ScalarEncoder(p, [1, 34]))
-
-    p = ScalarEncoderParameters(
-        minimum=-1.234,
-        maximum=12.34,
-        clip_input=True,
-        periodic=False,
-        active_bits=34,
-        sparsity=0.0,
-        size=0,
-        radius=0.1337,
-        category=False,
-        resolution=0.0,
-    )
-    inputs.append(ScalarEncoder(p, [1, 34]))
-
-    p = ScalarEncoderParameters(
-        minimum=-1.234,
-        maximum=12.34,
-        clip_input=False,
-        periodic=True,
-        active_bits=34,
-        sparsity=0.0,
-        size=0,
-        radius=0.1337,
-        category=False,
-        resolution=0.0,
-    )
-    inputs.append(ScalarEncoder(p, [1, 34]))
+    inputs.append(_make_scalar(astuple(p), (1, 34)))
+    inputs.append(_make_scalar(astuple(replace(p, clip_input=True)), (1, 34)))
+    inputs.append(_make_scalar(astuple(replace(p, periodic=True)), (1, 34)))
+    inputs.append(_make_scalar(astuple(replace(p, radius=0.0, resolution=0.1337)), (1, 34)))
 
-    p = ScalarEncoderParameters(
-        minimum=-1.234,
-        maximum=12.34,
-        clip_input=False,
-        periodic=False,
-        active_bits=34,
-        sparsity=0.0,
-        size=0,
-        radius=0.0,
-        category=False,
-        resolution=0.1337,
-    )
-    inputs.append(ScalarEncoder(p, [1, 34]))
+    q = replace(p, minimum=-1.0, maximum=1.003, active_bits=0, sparsity=0.15, size=100, radius=0.0)
+    inputs.append(_make_scalar(astuple(q), (1, 100)))
 
-    q = ScalarEncoderParameters(
-        minimum=-1.0,
-        maximum=1.003,
-        clip_input=False,
-        periodic=False,
-        active_bits=0,
-        sparsity=0.15,
-        size=100,
-        radius=0.0,
-        category=False,
-        resolution=0.0,
-    )
-    inputs.append(ScalarEncoder(q, [1, 100]))
-
-    r = ScalarEncoderParameters(
-        minimum=0,
-        maximum=65,
-        clip_input=False,
-        periodic=False,
-        active_bits=0,
-        sparsity=0.02,
-        size=700,
-        radius=0.0,
-        category=False,
-        resolution=0.0,
-    )
-    inputs.append(ScalarEncoder(r, [1, 700]))
-    inputs.append(ScalarEncoder(r, [1, 700]))
+    r = replace(q, minimum=0, maximum=65, sparsity=0.02, size=700)
+    inputs.append(_make_scalar(astuple(r), (1, 700)))
+    inputs.append(_make_scalar(astuple(r), (1, 700)))
+    assert inputs[-1] is inputs[-2]  # same signature, built once
 
     for encoder in inputs:
         if type(encoder) is ScalarEncoder:
@@ -374,3 +367,79 @@ def test_scalar_encoder_serialization():
             assert nearly_equal(p1.resolution, p2.resolution)
             assert nearly_equal(p1.sparsity, p2.sparsity)
             assert nearly_equal(p1.radius, p2.radius)
+
+
+def test_scalar_encoder_encode_batch_matches_encode():
+    """Test that encode_batch gives the same rows as encode, including NaN and periodic wrap."""
+
+    # Arrange
+    plain = ScalarEncoderParameters(
+        minimum=10.0,
+        maximum=20.0,
+        clip_input=False,
+        periodic=False,
+        active_bits=3,
+        sparsity=0.0,
+        size=0,
+        radius=0.0,
+        category=False,
+        resolution=1,
+    )
+    periodic = ScalarEncoderParameters(
+        minimum=10.0,
+        maximum=20.0,
+        clip_input=False,
+        periodic=True,
+        active_bits=3,
+        sparsity=0.0,
+        size=0,
+        radius=0.0,
+        category=False,
+        resolution=1,
+    )
+    values = np.array([10.0, 10.49, 10.5, 11.5, 14.2, 14.5, 17.0, 19.49, 19.6, 20.0, np.nan])
+
+    encoders = [ScalarEncoder(plain), ScalarEncoder(periodic)]
+
+    for encoder in encoders:
+        output = SDR([encoder.size])
+
+        # Act
+        encoded = encoder.encode_batch(values)
+        active = encoder.encode_batch_sparse(values)
+
+        # Assert
+        assert encoded.shape == (len(values), encoder.size)
+        assert active.shape == (len(values), 3)
+        for row, value in enumerate(values):
+            encoder.encode(float(value), output)
+            assert np.flatnonzero(encoded[row]).tolist() == output.get_sparse()
+            assert active[row][active[row] >= 0].tolist() == output.get_sparse()
+
+    with pytest.raises(ValueError):
+        encoders[0].encode_batch([15.0, 20.5])
+
+
+def test_scalar_encoder_blocks_from_ranges(base_scalar_params):
+    """Test that encode builds each block from ranges, splitting a periodic block that wraps."""
+
+    # Arrange
+    plain = replace(base_scalar_params, minimum=0.0, maximum=100.0, clip_input=True, size=10)
+    periodic = replace(plain, clip_input=False, periodic=True)
+    wide = replace(periodic, size=20000, active_bits=400)
+
+    # Act
+    plain_encoder = ScalarEncoder(plain)
+    periodic_encoder = ScalarEncoder(periodic)
+    wide_encoder = ScalarEncoder(wide)
+    plain_output = SDR([plain_encoder.size])
+    periodic_output = SDR([periodic_encoder.size])
+    wide_output = SDR([wide_encoder.size])
+    plain_encoder.encode(100.0, plain_output)
+    periodic_encoder.encode(93.0, periodic_output)
+    wide_encoder.encode(99.5, wide_output)
+
+    # Assert
+    assert plain_output.get_sparse() == [8, 9]
+    assert periodic_output.get_sparse() == [0, 9]
+    assert wide_output.get_sparse() == list(range(300)) + list(range(19900, 20000))
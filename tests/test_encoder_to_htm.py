@@ -8,6 +8,8 @@ from psu_capstone.input_layer.input_handler import InputHandler
 
 class DummyEncoder(BaseEncoder):
 
+    active_bits = 2
+
     def __init__(self, dimensions=None):
         if dimensions is None:
             dimensions = [8, 1]  # arbitrary SDR size for the test
@@ -15,8 +17,11 @@ class DummyEncoder(BaseEncoder):
     def attach_input(self, df: pd.DataFrame):
         self.input_df = df
 
-    def encode(self, input_value: float, output_sdr: SDR) -> None:
-        pass
+    def encode(self, input_value: float, output_sdr: SDR) -> bool:
+        # Contiguous block starting at the value, written with one set_sparse call.
+        start = min(int(input_value), output_sdr.size - self.active_bits)
+        output_sdr.set_sparse(list(range(start, start + self.active_bits)))
+        return True
 
 
 # Note: This is expected to fail because we do not have an HTM interface yet
@@ -67,3 +72,4 @@ def test_encoder_to_htm_receives_sdr_object():
     assert df.shape == (8, 1)
     assert isinstance(sdr, SDR)
     assert htm.last_received_sdr is sdr
+    assert htm.last_received_sdr.get_sparse() == [2, 3]
@@ -1,8 +1,12 @@
 """Test suite for SDR operations."""
 
+import copy
+import random
+
+import numpy as np
 import pytest
 
-from psu_capstone.encoder_layer.sdr import SDR
+from psu_capstone.encoder_layer.sdr import SDR, _pack_bits, _sparse_from_words
 
 
 @pytest.fixture
@@ -68,6 +72,24 @@ def test_sdr_set_coordinates_and_get_coordinates(sdr_fixture):
     assert out == coords
 
 
+def test_sdr_coordinates_round_trip_through_sparse():
+    """Test that coordinates derive from sparse and sparse derives from coordinates."""
+
+    # Arrange
+    sdr = SDR([2, 3, 4])
+    other = SDR([2, 3, 4])
+    sdr.set_sparse([0, 7, 13, 23])
+
+    # Act
+    coords = sdr.get_coordinates()
+    other.set_coordinates([[1, 0], [0, 1], [1, 3]])
+    sparse = other.get_sparse()
+
+    # Assert
+    assert coords == [[0, 0, 1, 1], [0, 1, 0, 2], [0, 3, 1, 3]]
+    assert sparse == [7, 13]
+
+
 def test_sdr_reshape(sdr_fixture):
     # Arrange
     sdr = sdr_fixture
@@ -125,6 +147,84 @@ def test_sdr_get_overlap(sdr_fixture):
     assert overlap == 2
 
 
+def test_sdr_metrics_multi_word():
+    """Test sum, sparsity, and overlap on SDRs spanning several packed words."""
+
+    # Arrange
+    sdr1 = SDR([64, 32])
+    sdr2 = SDR([64, 32])
+    sdr1.randomize(0.1)
+    sdr2.set_dense([1 if i % 3 == 0 else 0 for i in range(2048)])
+    expected_overlap = len(set(sdr1.get_sparse()) & set(range(0, 2048, 3)))
+
+    # Act
+    overlap = sdr1.get_overlap(sdr2)
+    s = sdr2.get_sum()
+    sparsity = sdr2.get_sparsity()
+
+    # Assert
+    assert overlap == expected_overlap
+    assert s == 683
+    assert sparsity == 683 / 2048
+
+
+def test_sdr_views_unpack_from_words():
+    """Test that dense and sparse views rebuilt from packed words match across word edges."""
+
+    # Arrange
+    sdr = SDR([3, 50])
+    other = SDR([3, 50])
+    sdr.set_sparse([0, 63, 64, 127, 128, 149])
+
+    # Act
+    dense = sdr.get_dense()
+    other.set_coordinates([[0, 1, 2], [10, 14, 49]])
+    other_sum = other.get_sum()
+    other_dense = other.get_dense()
+
+    # Assert
+    assert [i for i, bit in enumerate(dense) if bit] == [0, 63, 64, 127, 128, 149]
+    assert other_sum == 3
+    assert [i for i, bit in enumerate(other_dense) if bit] == [10, 64, 149]
+
+
+def test_sparse_from_words_skips_empty_words():
+    """Test that sparse indices read from packed words match the bits that were packed."""
+
+    # Arrange
+    size = 1000
+    active = [0, 63, 64, 500, 511, 512, 999]
+    words = _pack_bits(active, size, sparse=True)
+
+    # Act
+    sparse = _sparse_from_words(words)
+    empty = _sparse_from_words(np.zeros_like(words))
+
+    # Assert
+    assert sparse == active
+    assert empty == []
+
+
+def test_sdr_get_overlap_small_paths_agree():
+    """Test that small SDRs give the same overlap via sparse indices or packed words."""
+
+    # Arrange
+    sdr1 = SDR([100])
+    sdr2 = SDR([100])
+    sdr1.set_sparse([1, 2, 3, 50, 99])
+    sdr2.set_sparse([2, 3, 4, 99])
+    sdr3 = SDR([100])
+    sdr3.set_dense(sdr2.get_dense())
+
+    # Act
+    sparse_overlap = sdr1.get_overlap(sdr2)
+    word_overlap = sdr1.get_overlap(sdr3)
+
+    # Assert
+    assert sparse_overlap == 3
+    assert word_overlap == 3
+
+
 def test_sdr_intersection_and_union(sdr_fixture):
     # Arrange
     sdr1 = SDR([3])
@@ -157,6 +257,26 @@ def test_sdr_concatenate(sdr_fixture):
     assert result == [1, 0, 0, 1]
 
 
+def test_sdr_concatenate_2d_axes():
+    """Test concatenation of 2-D SDRs along both axes."""
+
+    # Arrange
+    sdr1 = SDR([2, 3])
+    sdr2 = SDR([2, 3])
+    sdr1.set_sparse([0, 4])
+    sdr2.set_sparse([2, 3])
+    rows = SDR([4, 3])
+    cols = SDR([2, 6])
+
+    # Act
+    rows.concatenate([sdr1, sdr2], axis=0)
+    cols.concatenate([sdr1, sdr2], axis=1)
+
+    # Assert
+    assert rows.get_sparse() == [0, 4, 8, 9]
+    assert cols.get_sparse() == [0, 5, 7, 9]
+
+
 def test_sdr_callbacks(sdr_fixture):
     # Arrange
     sdr = SDR([2])
@@ -185,6 +305,28 @@ def test_sdr_callbacks(sdr_fixture):
     assert called
 
 
+def test_sdr_clone_and_deepcopy():
+    """Test that clone and deepcopy give independent SDRs without callbacks."""
+
+    # Arrange
+    sdr = SDR([4, 5])
+    sdr.set_sparse([1, 7, 19])
+    called = []
+    sdr.add_on_change_callback(lambda: called.append(True))
+
+    # Act
+    cloned = sdr.clone()
+    deep = copy.deepcopy(sdr)
+    cloned.set_sparse([0])
+
+    # Assert
+    assert deep == sdr
+    assert deep.get_dimensions() == [4, 5]
+    assert cloned.get_sparse() == [0]
+    assert sdr.get_sparse() == [1, 7, 19]
+    assert not called
+
+
 def test_sdr_randomize_add_noise_kill_cells(sdr_fixture):
     # Arrange
     sdr = SDR([10])
@@ -202,6 +344,84 @@ def test_sdr_randomize_add_noise_kill_cells(sdr_fixture):
     assert sum_after_kill <= 5
 
 
+def test_sdr_random_ops_on_words_keep_counts():
+    """Test that randomize, add_noise, and kill_cells keep their bit counts across word edges."""
+
+    # Arrange
+    sdr = SDR([10, 30])
+    expected = sorted(random.Random(3).sample(range(300), 60))
+
+    # Act
+    sdr.randomize(0.2, random.Random(3))
+    randomized = list(sdr.get_sparse())
+    sdr.add_noise(0.5, random.Random(4))
+    noisy = set(sdr.get_sparse())
+    sdr.kill_cells(0.5, seed=5)
+    survivors = set(sdr.get_sparse())
+
+    # Assert
+    assert randomized == expected
+    assert len(noisy) == 60
+    assert len(noisy & set(randomized)) == 30
+    assert survivors <= noisy
+    assert sdr.get_sum() == len(survivors)
+    assert sdr.get_dense().count(1) == len(survivors)
+
+
+def test_sdr_get_dense_array_shape_and_copy():
+    """Test that get_dense_array matches get_dense, has the SDR's shape, and is a copy."""
+
+    # Arrange
+    sdr = SDR([3, 50])
+    sdr.set_sparse([0, 63, 64, 149])
+
+    # Act
+    grid = sdr.get_dense_array()
+    grid[0, 0] = 0
+
+    # Assert
+    assert grid.shape == (3, 50)
+    assert grid.dtype == np.uint8
+    assert sdr.get_dense_array().reshape(-1).tolist() == sdr.get_dense()
+    assert sdr.get_sparse() == [0, 63, 64, 149]
+
+
+def test_sdr_randomize_with_numpy_generator():
+    """Test that randomize and add_noise accept NumPy generators and default to a shared one."""
+
+    # Arrange
+    seeded = SDR([10, 30])
+    default = SDR([10, 30])
+
+    # Act
+    seeded.randomize(0.2, np.random.default_rng(7))
+    seeded_bits = list(seeded.get_sparse())
+    seeded.add_noise(0.5, np.random.default_rng(8))
+    default.randomize(0.2)
+
+    # Assert
+    assert len(seeded_bits) == 60
+    assert seeded_bits == sorted(np.random.default_rng(7).choice(300, 60, replace=False))
+    assert seeded.get_sum() == 60
+    assert len(set(seeded.get_sparse()) & set(seeded_bits)) == 30
+    assert default.get_sum() == 60
+
+
+def test_sdr_randomize_then_set_sparse_inplace_keeps_bits():
+    """Test that the sparse buffer is current after randomize, so marking it in place is a no-op."""
+
+    # Arrange
+    sdr = SDR([20, 50])
+    expected = sorted(random.Random(0).sample(range(1000), 20))
+
+    # Act
+    sdr.randomize(0.02, random.Random(0))
+    sdr.set_sparse_inplace()
+
+    # Assert
+    assert sdr.get_sparse() == expected
+
+
 def test_sdr_eq_repr(sdr_fixture):
     # Arrange
     sdr1 = SDR([3])
@@ -216,6 +436,29 @@ def test_sdr_eq_repr(sdr_fixture):
     assert "SDR(dimensions=[3], size=3, active=2)" in repr_result
 
 
+def test_sdr_eq_mismatches():
+    """Test equality across differing sizes, active counts, and bit positions."""
+
+    # Arrange
+    sdr1 = SDR([100])
+    sdr2 = SDR([100])
+    sdr3 = SDR([100])
+    sdr4 = SDR([10, 10])
+    sdr1.set_sparse([1, 64, 99])
+    sdr2.set_dense(sdr1.get_dense())
+    sdr3.set_sparse([1, 65, 99])
+    sdr4.set_sparse([1, 64, 99])
+
+    # Act & Assert
+    assert sdr1 == sdr2
+    assert sdr1 != sdr3
+    assert sdr1 != SDR([100])
+    assert sdr1 != SDR([101])
+    assert sdr1 != sdr4
+    with pytest.raises(TypeError):
+        hash(sdr1)
+
+
 def test_sdr_set_and_get_sparse():
     """Test setting and getting sparse representation."""
 
@@ -260,6 +503,75 @@ def test_sdr_set_dense():
     assert sdr.get_sparse() == [1, 3, 4]
 
 
+def test_sdr_set_dense_generator_and_array():
+    """Test that dense input from a generator or array fills both views."""
+
+    # Arrange
+    sdr1 = SDR([6])
+    sdr2 = SDR([6])
+    dense_representation = [0, 0, 1, 0, 1, 1]
+
+    # Act
+    sdr1.set_dense(bit for bit in dense_representation)
+    sdr2.set_dense(np.array(dense_representation, dtype=np.uint8))
+
+    # Assert
+    assert sdr1.get_sparse() == [2, 4, 5]
+    assert sdr1.get_dense() == dense_representation
+    assert sdr2.get_sparse() == [2, 4, 5]
+    assert sdr2.get_dense() == dense_representation
+
+
+def test_sdr_get_dense_cached_and_read_only():
+    """Test that get_dense reuses one read-only list until the SDR value changes."""
+
+    # Arrange
+    sdr = SDR([8])
+    sdr.set_sparse([1])
+
+    # Act
+    first = sdr.get_dense()
+    second = sdr.get_dense()
+    with pytest.raises(TypeError):
+        first[5] = 1
+    with pytest.raises(TypeError):
+        first.append(1)
+    writable = copy.copy(first)
+    writable[5] = 1
+    sdr.set_sparse([2])
+    third = sdr.get_dense()
+
+    # Assert
+    assert first is second
+    assert first == [0, 1, 0, 0, 0, 0, 0, 0]
+    assert type(writable) is list
+    assert third == [0, 0, 1, 0, 0, 0, 0, 0]
+    assert sdr.get_sparse() == [2]
+
+
+def test_sdr_set_dense_inplace_after_get_dense():
+    """Test that in-place dense edits and union both replace the cached get_dense list."""
+
+    # Arrange
+    sdr = SDR([6])
+    sdr.set_sparse([1])
+    other = SDR([6])
+    other.set_sparse([4])
+
+    # Act
+    before_edit = sdr.get_dense()
+    sdr._dense[3] = 1
+    sdr.set_dense_inplace()
+    edited = sdr.get_dense()
+    sdr.set_union([sdr, other])
+
+    # Assert
+    assert before_edit == [0, 1, 0, 0, 0, 0]
+    assert edited == [0, 1, 0, 1, 0, 0]
+    assert sdr.get_sparse() == [1, 3, 4]
+    assert sdr.get_dense() == [0, 1, 0, 1, 1, 0]
+
+
 def test_sdr_64_32_init():
     """Test SDR creation with dimensions [64, 32]."""
 
@@ -2,7 +2,6 @@
 
 from time import time
 
-import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 import pytest
@@ -10,71 +9,91 @@ from matplotlib.colors import ListedColormap
 
 from psu_capstone.encoder_layer.sdr import SDR
 
+# Every visual test draws OFF bits white and ON bits blue.
+_SDR_CMAP = ListedColormap(["white", "#1f77b4"])
+
 
 @pytest.fixture
-def sdr_visualization(debug=False):
-    """Fixture for SDR visualization tests."""
-    pass  # No setup needed for this simple visualization test
+def sdr_figure():
+    """A fresh figure laid out like the union view, closed once the test is done.
+
+    Each axes holds a single placeholder image that draw_grid fills with set_data.
+    """
+    fig = plt.figure(figsize=(10, 10))
+    gs = fig.add_gridspec(2, 3, height_ratios=[3, 2])
+    axes = {
+        "one": fig.add_subplot(gs[0, 0]),
+        "two": fig.add_subplot(gs[0, 1]),
+        "three": fig.add_subplot(gs[0, 2]),
+        "union": fig.add_subplot(gs[1, 0]),
+    }
+    for ax in axes.values():
+        ax.imshow(np.zeros((1, 1)), cmap=_SDR_CMAP, vmin=0, vmax=1, interpolation="nearest")
+        ax.set_xticks([])
+        ax.set_yticks([])
+        ax.set_visible(False)  # shown once a test draws into it
+    yield fig, axes
+    plt.close(fig)
+
+
+def draw_grid(
+    ax, grid: np.ndarray, title: str, cmap: ListedColormap = _SDR_CMAP, aspect="equal"
+) -> None:
+    """Replace the image on ``ax`` with ``grid`` and resize the axes to fit it."""
+    rows, cols = grid.shape
+    image = ax.images[0]
+    image.set_data(grid)
+    image.set_cmap(cmap)
+    image.set_extent((-0.5, cols - 0.5, rows - 0.5, -0.5))
+    ax.set_xlim(-0.5, cols - 0.5)
+    ax.set_ylim(rows - 0.5, -0.5)
+    ax.set_aspect(aspect)
+    ax.set_title(title)
+    ax.set_visible(True)
+
+
+def render(fig, tmp_path, show: bool) -> None:
+    """Show the figure when running interactively, otherwise rasterize it to a PNG."""
+    if show:
+        plt.show(block=True)
+        return
+    out = tmp_path / "out.png"
+    fig.savefig(out)
+    assert out.stat().st_size > 0
 
 
 @pytest.mark.visual
-def test_sdr_visualization(sdr_visualization):
+def test_sdr_visualization(sdr_figure, tmp_path, show_figures):
     """Test the visualization of an SDR."""
 
-    # sdr.get_dense() should return a list or 1D array of 0/1
+    # get_dense_array() is already shaped like the SDR, so it is drawn as a 64 x 32 grid
     sdr = SDR([64, 32])
     sdr.randomize(0.02)
     sdr.add_noise(0.01)
-    dense = np.array(sdr.get_dense())
-
-    # compute square grid size
-    n = dense.size
-    side = int(np.ceil(np.sqrt(n)))  # smallest square that fits SDR
+    grid = sdr.get_dense_array()
 
-    # pad if needed
-    padded = np.zeros(side * side, dtype=int)
-    padded[:n] = dense
-
-    grid = padded.reshape(side, side)
-
-    # colormap: white for 0, blue for 1
-    cmap = ListedColormap(["white", "blue"])
-
-    plt.figure(figsize=(10, 10))
-    plt.imshow(grid, cmap=cmap, interpolation="nearest")
-    title = "SDR Visualization"
-    plt.title(title)
-    plt.xticks([])
-    plt.yticks([])
-    plt.grid(False)
-    plt.show(block=True)
+    fig, axes = sdr_figure
+    draw_grid(axes["one"], grid, "SDR Visualization")
+    render(fig, tmp_path, show_figures)
 
 
 @pytest.mark.visual
-def test_sdr_one_row_visual():
+def test_sdr_one_row_visual(sdr_figure, tmp_path, show_figures):
     """Test visualization of a single row SDR."""
     # Arrange
     sdr = SDR([100])
     sdr.randomize(0.05)
 
-    dense = np.array(sdr.get_dense())
-    arr2d = dense.reshape(1, -1)  # one row, N columns
+    arr2d = sdr.get_dense_array().reshape(1, -1)  # one row, N columns
 
-    # ON bits = blue, OFF bits = white
-    cmap = ListedColormap(["white", "blue"])
-
-    plt.figure(figsize=(12, 2))
-    plt.imshow(arr2d, cmap=cmap, aspect="auto", interpolation="nearest")
-    plt.yticks([])  # Remove y-axis
-    plt.xlabel("Bit Index")
-    plt.title("SDR (1D One-Row Visual)")
-    plt.show()
+    fig, axes = sdr_figure
+    draw_grid(axes["union"], arr2d, "SDR (1D One-Row Visual)", aspect="auto")
+    axes["union"].set_xlabel("Bit Index")
+    render(fig, tmp_path, show_figures)
 
 
 @pytest.mark.visual
-def test_sdr_union_visual():
-    print(">> running test_sdr_union_layout_visual")  # sanity check
-
+def test_sdr_union_visual(sdr_figure, tmp_path, show_figures):
     rows, cols = 20, 50  # size of each small SDR grid
 
     # --- Create three SDRs (each 16x16) ---
@@ -99,45 +118,18 @@ def test_sdr_union_visual():
     sdr_union.concatenate([sdr1, sdr2, sdr3], axis=0)
 
     # --- Convert SDRs to 2D dense numpy arrays ---
-    grid1 = np.array(sdr1.get_dense(), dtype=int).reshape(rows, cols)
-    grid2 = np.array(sdr2.get_dense(), dtype=int).reshape(rows, cols)
-    grid3 = np.array(sdr3.get_dense(), dtype=int).reshape(rows, cols)
-
-    union_grid = np.array(sdr_union.get_dense(), dtype=int).reshape(rows * 3, cols)
-
-    # --- Colormap: 0 -> white, 1 -> blue ---
-    cmap = ListedColormap(["white", "#1f77b4"])
-
-    # --- Figure layout that matches your screenshot ---
-    fig = plt.figure(figsize=(10, 10))
-    gs = fig.add_gridspec(2, 3, height_ratios=[3, 2])
-
-    ax1 = fig.add_subplot(gs[0, 0])
-    ax2 = fig.add_subplot(gs[0, 1])
-    ax3 = fig.add_subplot(gs[0, 2])
-    ax_union = fig.add_subplot(gs[1, 0])
-
-    ax1.imshow(grid1, cmap=cmap, interpolation="nearest")
-    ax1.set_title("SDR One")
-    ax1.set_xticks([])
-    ax1.set_yticks([])
-
-    ax2.imshow(grid2, cmap=cmap, interpolation="nearest")
-    ax2.set_title("SDR Two")
-    ax2.set_xticks([])
-    ax2.set_yticks([])
-
-    ax3.imshow(grid3, cmap=cmap, interpolation="nearest")
-    ax3.set_title("SDR Three")
-    ax3.set_xticks([])
-    ax3.set_yticks([])
+    grid1 = sdr1.get_dense_array()
+    grid2 = sdr2.get_dense_array()
+    grid3 = sdr3.get_dense_array()
 
-    ax_union.imshow(union_grid, cmap=cmap, interpolation="nearest", aspect="auto")
-    ax_union.set_title("Union")
-    ax_union.set_xticks([])
-    ax_union.set_yticks([])
+    union_grid = sdr_union.get_dense_array()
 
-    plt.tight_layout()
-    plt.show(block=True)
+    # --- Figure layout that matches your screenshot (built by sdr_figure) ---
+    fig, axes = sdr_figure
+    draw_grid(axes["one"], grid1, "SDR One")
+    draw_grid(axes["two"], grid2, "SDR Two")
+    draw_grid(axes["three"], grid3, "SDR Three")
+    draw_grid(axes["union"], union_grid, "Union", aspect="auto")
 
-    print(">> finished test_sdr_union_layout_visual")
+    fig.tight_layout()
+    render(fig, tmp_path, show_figures)